@@ -12,10 +12,10 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 import voluptuous as vol
 
-from .api import EnergyTrackerApi
+from .api import EnergyTrackerApi, async_close_connector
 from .const import CONF_API_TOKEN, DOMAIN, PLATFORMS, SERVICE_SEND_METER_READING
 
-type EnergyTrackerConfigEntry = ConfigEntry[str]
+type EnergyTrackerConfigEntry = ConfigEntry[EnergyTrackerApi]
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
@@ -37,10 +37,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
-def _select_token_for_service(hass: HomeAssistant, call: ServiceCall) -> str | None:
-    """Select the API token for a service call.
+def _select_api_for_service(
+    hass: HomeAssistant, call: ServiceCall
+) -> EnergyTrackerApi | None:
+    """Select the API client for a service call.
 
-    Retrieves the API token for the Energy Tracker integration based on the
+    Retrieves the API client of the Energy Tracker integration based on the
     config entry ID provided in the service call data.
 
     Args:
@@ -48,7 +50,7 @@ def _select_token_for_service(hass: HomeAssistant, call: ServiceCall) -> str | N
         call: The service call containing the 'entry_id'.
 
     Returns:
-        The API token as a string if found, otherwise None.
+        The API client of the config entry if found, otherwise None.
     """
     entry_id: str | None = call.data.get("entry_id")
     if not entry_id:
@@ -62,12 +64,12 @@ def _select_token_for_service(hass: HomeAssistant, call: ServiceCall) -> str | N
         LOGGER.debug("Integration with ID %s was deleted", entry_id)
         return None
 
-    token = entry.runtime_data
-    if not token:
-        LOGGER.error("API token not found for entry ID %s", entry_id)
+    api = entry.runtime_data
+    if not api:
+        LOGGER.error("API client not found for entry ID %s", entry_id)
         return None
 
-    return token
+    return api
 
 
 async def async_handle_send_meter_reading(
@@ -131,15 +133,13 @@ async def async_handle_send_meter_reading(
         )
     timestamp = state_obj.last_updated
 
-    token = _select_token_for_service(hass, call)
-    if not token:
+    api = _select_api_for_service(hass, call)
+    if not api:
         raise HomeAssistantError(
             translation_domain=DOMAIN,
             translation_key="no_api_token",
         )
 
-    api = EnergyTrackerApi(hass=hass, token=token)
-
     await api.send_meter_reading(
         source_entity_id=source_entity_id,
         device_id=device_id,
@@ -163,7 +163,7 @@ async def async_setup_entry(
     """
     LOGGER.info("Setting up Energy Tracker integration for entry %s", entry.entry_id)
 
-    entry.runtime_data = entry.data[CONF_API_TOKEN]
+    entry.runtime_data = EnergyTrackerApi(hass=hass, token=entry.data[CONF_API_TOKEN])
 
     if not hass.services.has_service(DOMAIN, SERVICE_SEND_METER_READING):
 
@@ -193,7 +193,8 @@ async def async_unload_entry(
 ) -> bool:
     """Unload a config entry for the Energy Tracker integration.
 
-    Unregisters the service if this was the last loaded config entry.
+    Unregisters the service and closes the shared connection pool if this
+    was the last loaded config entry.
 
     Args:
         hass: The Home Assistant instance.
@@ -211,6 +212,8 @@ async def async_unload_entry(
         LOGGER.warning("Failed to unload platforms for entry %s", entry.entry_id)
         return False
 
+    await entry.runtime_data.async_close()
+
     # Check if there are other loaded entries for this domain
     loaded_entries = [
         e
@@ -219,6 +222,8 @@ async def async_unload_entry(
     ]
 
     if not loaded_entries:
+        await async_close_connector(hass)
+
         if hass.services.has_service(DOMAIN, SERVICE_SEND_METER_READING):
             hass.services.async_remove(DOMAIN, SERVICE_SEND_METER_READING)
             LOGGER.info(
@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime
+import hashlib
 import logging
+import random
+import time
+from typing import Any, NamedTuple
 
+import aiohttp
 from energy_tracker_api import (
     AuthenticationError,
     ConflictError,
@@ -19,15 +29,54 @@ from energy_tracker_api import (
     TimeoutError,
     ValidationError,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-
-from .const import DOMAIN
+from homeassistant.helpers.aiohttp_client import ENABLE_CLEANUP_CLOSED
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import json_loads
+from homeassistant.util.ssl import client_context
+
+from .const import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RECOVERY_TIME,
+    CONCURRENCY_DECREASE_FACTOR,
+    CONCURRENCY_INCREASE,
+    CONCURRENCY_INITIAL,
+    CONCURRENCY_LATENCY_WINDOW,
+    CONCURRENCY_MAX,
+    CONCURRENCY_MIN,
+    CONCURRENCY_TARGET_LATENCY,
+    DOMAIN,
+    GET_MAX_RETRIES,
+    RATE_LIMIT_LOW_WATERMARK,
+    RATE_LIMIT_MAX_RETRY_AFTER,
+    RATE_LIMIT_WINDOW,
+    REQUEST_CONNECT_TIMEOUT,
+    REQUEST_TIMEOUT,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+    SERVER_ERROR_MAX_RETRIES,
+)
 
 LOGGER = logging.getLogger(__name__)
 
+# Device list endpoint, relative to the SDK client's base URL
+_DEVICES_ENDPOINT = "/v1/devices/standard"
 
-@dataclass
+# Connection pool shared by the sessions of all config entries
+DATA_CONNECTOR: HassKey[aiohttp.TCPConnector] = HassKey(f"{DOMAIN}_connector")
+# Removes the listener that closes the pool when Home Assistant shuts down
+_DATA_CONNECTOR_UNSUB: HassKey[CALLBACK_TYPE] = HassKey(f"{DOMAIN}_connector_unsub")
+
+# Idempotency key of the meter reading currently being posted, if any
+_IDEMPOTENCY_KEY: ContextVar[str | None] = ContextVar(
+    "energy_tracker_idempotency_key", default=None
+)
+
+
+@dataclass(slots=True, frozen=True)
 class DeviceSummary:
     """Represents a summary of a measuring device."""
 
@@ -37,7 +86,16 @@ class DeviceSummary:
     last_updated_at: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class _CachedDevices:
+    """A fetched device list and the validators it was served with."""
+
+    devices: list[DeviceSummary]
+    etag: str | None
+    last_modified: str | None
+
+
+@dataclass(slots=True, frozen=True)
 class MeterReading:
     """Represents a meter reading."""
 
@@ -49,6 +107,378 @@ class MeterReading:
     meter_number: str | None
 
 
+def _is_server_error(err: EnergyTrackerAPIError) -> bool:
+    """Return True if the error was caused by an HTTP 5xx response."""
+    return type(err) is EnergyTrackerAPIError and str(err).startswith("Server error")
+
+
+class _ErrorTranslation(NamedTuple):
+    """Translation key, log level and log description for an API error."""
+
+    translation_key: str
+    level: int
+    description: str
+
+
+# Translation of each API error, keyed by exception type
+_ERROR_TRANSLATIONS: dict[type[EnergyTrackerAPIError], _ErrorTranslation] = {
+    ValidationError: _ErrorTranslation(  # HTTP 400
+        translation_key="bad_request",
+        level=logging.WARNING,
+        description="Validation error",
+    ),
+    AuthenticationError: _ErrorTranslation(  # HTTP 401
+        translation_key="auth_failed",
+        level=logging.ERROR,
+        description="Authentication failed",
+    ),
+    ForbiddenError: _ErrorTranslation(  # HTTP 403
+        translation_key="auth_failed",
+        level=logging.ERROR,
+        description="Access forbidden",
+    ),
+    ResourceNotFoundError: _ErrorTranslation(  # HTTP 404
+        translation_key="device_not_found",
+        level=logging.WARNING,
+        description="Device not found",
+    ),
+    ConflictError: _ErrorTranslation(  # HTTP 409
+        translation_key="conflict",
+        level=logging.WARNING,
+        description="Conflict",
+    ),
+    RateLimitError: _ErrorTranslation(  # HTTP 429
+        translation_key="rate_limit",
+        level=logging.WARNING,
+        description="Rate limit exceeded",
+    ),
+    TimeoutError: _ErrorTranslation(
+        translation_key="timeout",
+        level=logging.ERROR,
+        description="Request timeout",
+    ),
+    NetworkError: _ErrorTranslation(
+        translation_key="network_error",
+        level=logging.ERROR,
+        description="Network error",
+    ),
+}
+
+# Used for HTTP 5xx and any other API error without its own entry
+_DEFAULT_ERROR_TRANSLATION = _ErrorTranslation(
+    translation_key="server_error",
+    level=logging.ERROR,
+    description="API error",
+)
+
+
+def _translate_error(
+    err: EnergyTrackerAPIError, operation: str, *, fallback: str | None = None
+) -> HomeAssistantError:
+    """Log an API error and return the matching Home Assistant exception.
+
+    Args:
+        err: The error raised by the API client.
+        operation: What was being done, e.g. "fetching devices", for the log.
+        fallback: Message shown for a bad request without an API message.
+            Defaults to the error itself.
+    """
+    translation_key, level, description = _ERROR_TRANSLATIONS.get(
+        type(err), _DEFAULT_ERROR_TRANSLATION
+    )
+    LOGGER.log(level, "%s %s: %s", description, operation, err)
+
+    placeholders: dict[str, str] | None = None
+    if isinstance(err, RateLimitError):
+        if err.retry_after:
+            placeholders = {"retry_after": str(err.retry_after)}
+        else:
+            translation_key = "rate_limit_no_time"
+    elif translation_key in ("bad_request", "conflict", "server_error"):
+        if translation_key != "bad_request" or fallback is None:
+            fallback = str(err)
+        placeholders = {
+            "error": "; ".join(err.api_message) if err.api_message else fallback
+        }
+
+    return HomeAssistantError(
+        translation_domain=DOMAIN,
+        translation_key=translation_key,
+        translation_placeholders=placeholders,
+    )
+
+
+def _idempotency_key(device_id: str, timestamp: datetime, value: float) -> str:
+    """Return a stable idempotency key for a meter reading."""
+    return hashlib.blake2b(
+        f"{device_id}|{timestamp.isoformat()}|{value}".encode(), digest_size=16
+    ).hexdigest()
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Return an exponential backoff delay with full jitter for a retry attempt."""
+    return random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2**attempt))
+
+
+@callback
+def _async_get_connector(hass: HomeAssistant) -> aiohttp.TCPConnector:
+    """Return the shared connection pool, creating it on first use.
+
+    The pool is closed when Home Assistant shuts down or the last config
+    entry is unloaded.
+    """
+    connector = hass.data.get(DATA_CONNECTOR)
+    if connector is None or connector.closed:
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=CONCURRENCY_MAX,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=ENABLE_CLEANUP_CLOSED,
+            ssl=client_context(),
+        )
+        hass.data[DATA_CONNECTOR] = connector
+
+        async def _async_close_connector(event: Event) -> None:
+            # The listener is removed once it has fired
+            hass.data.pop(_DATA_CONNECTOR_UNSUB, None)
+            await connector.close()
+
+        if (unsub := hass.data.pop(_DATA_CONNECTOR_UNSUB, None)) is not None:
+            unsub()
+        hass.data[_DATA_CONNECTOR_UNSUB] = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, _async_close_connector
+        )
+    return connector
+
+
+async def async_close_connector(hass: HomeAssistant) -> None:
+    """Close the shared connection pool, if one was created."""
+    if (unsub := hass.data.pop(_DATA_CONNECTOR_UNSUB, None)) is not None:
+        unsub()
+    if (connector := hass.data.pop(DATA_CONNECTOR, None)) is not None:
+        await connector.close()
+
+
+class _CircuitBreaker:
+    """Circuit breaker that stops calls to a failing backend.
+
+    The breaker is closed while requests succeed. After a number of
+    consecutive failures it opens and rejects calls for the recovery time.
+    Once that has passed it is half-open: a single probe call is let through
+    while others are still rejected. A probe that gets any answer other than
+    a server error closes the breaker; every other outcome re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int, recovery_time: float) -> None:
+        """Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures before the breaker opens.
+            recovery_time: Seconds the breaker stays open before probing.
+        """
+        self._failure_threshold = failure_threshold
+        self._recovery_time = recovery_time
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    def allow_request(self) -> tuple[bool, bool]:
+        """Return whether a call may contact the backend and if it is the probe.
+
+        When the breaker is half-open, the first caller becomes the probe and
+        must call release() once its request has finished.
+        """
+        if self._opened_at is None:
+            return True, False
+        if self._probing or (time.monotonic() - self._opened_at < self._recovery_time):
+            return False, False
+        self._probing = True
+        return True, True
+
+    def release(self) -> None:
+        """Let the next call probe the backend after the probe has finished.
+
+        If the probe did not close the breaker, it is re-opened for another
+        recovery time.
+        """
+        self._probing = False
+        if self._opened_at is not None:
+            self._opened_at = time.monotonic()
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failed request and open the breaker at the threshold."""
+        self._failures += 1
+        if self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
+
+
+class _AdaptiveLimiter:
+    """Concurrency limiter with an AIMD-controlled limit.
+
+    While the mean latency of recent requests stays at or below the target the
+    limit grows additively; a latency overrun, rate limit, timeout or server
+    error shrinks it multiplicatively, at most once per congestion event:
+    requests that started before the last decrease cannot shrink it again.
+    The limit always stays between the configured minimum and maximum.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_limit: int,
+        max_limit: int,
+        initial_limit: int,
+        increase: float,
+        decrease_factor: float,
+        target_latency: float,
+        window: int,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            min_limit: Lowest number of concurrent requests allowed.
+            max_limit: Highest number of concurrent requests allowed.
+            initial_limit: Number of concurrent requests allowed at start.
+            increase: Amount added to the limit after a healthy request.
+            decrease_factor: Factor applied to the limit on overload.
+            target_latency: Mean latency in seconds considered healthy.
+            window: Number of recent latencies used for the mean.
+        """
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._limit = float(initial_limit)
+        self._increase = increase
+        self._decrease_factor = decrease_factor
+        self._target_latency = target_latency
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Return the current number of concurrent requests allowed."""
+        return int(self._limit)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a request slot for the duration of one API call.
+
+        The call's latency and outcome are fed back into the limit.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+        started = time.monotonic()
+        overloaded = False
+        try:
+            yield
+        except (RateLimitError, TimeoutError):
+            overloaded = True
+            raise
+        except EnergyTrackerAPIError as err:
+            overloaded = _is_server_error(err)
+            raise
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._adjust(started, time.monotonic() - started, overloaded)
+                self._condition.notify_all()
+
+    def _adjust(self, started: float, latency: float, overloaded: bool) -> None:
+        """Apply the AIMD rule after a request has finished."""
+        if not overloaded:
+            self._latencies.append(latency)
+            mean_latency = sum(self._latencies) / len(self._latencies)
+            if mean_latency <= self._target_latency:
+                self._limit = min(self._max_limit, self._limit + self._increase)
+                return
+
+        if started < self._last_decrease:
+            # Sent before the last decrease, so part of the congestion event
+            # that has already been answered
+            return
+
+        self._limit = max(self._min_limit, self._limit * self._decrease_factor)
+        self._last_decrease = time.monotonic()
+        self._latencies.clear()
+
+
+class _RateLimitTracker:
+    """Client-side pacing based on the backend's rate limit headers.
+
+    Every response updates the advertised limit and remaining budget. When
+    the remaining budget runs low, new requests wait for the window to reset
+    instead of provoking a 429. As a backstop, request start times are kept
+    in a sliding window capped at the advertised limit.
+    """
+
+    def __init__(self, low_watermark: float, window: float) -> None:
+        """Initialize the tracker.
+
+        Args:
+            low_watermark: Share of the limit below which requests are paused.
+            window: Length in seconds of the window the limit applies to.
+        """
+        self._low_watermark = low_watermark
+        self._window = window
+        self._limit: int | None = None
+        self._paused_until = 0.0
+        self._request_starts: deque[float] = deque()
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Record the rate limit state advertised in response headers."""
+        try:
+            limit = int(headers["X-RateLimit-Limit"])
+            remaining = int(headers["X-RateLimit-Remaining"])
+        except (KeyError, ValueError):
+            return
+
+        self._limit = limit if limit > 0 else None
+        reset = headers.get("X-RateLimit-Reset", "")
+        if not self._limit or remaining / limit >= self._low_watermark:
+            return
+        if not reset.isdigit():
+            return
+
+        reset_in = float(reset)
+        if reset_in > time.time():
+            # Absolute epoch timestamp rather than seconds until reset
+            reset_in -= time.time()
+        self._paused_until = time.monotonic() + min(reset_in, self._window)
+
+    async def wait(self) -> None:
+        """Wait until a request may be started without exceeding the limit."""
+        now = time.monotonic()
+        if self._paused_until > now:
+            LOGGER.debug(
+                "Rate limit nearly exhausted, pausing requests for %.1f seconds",
+                self._paused_until - now,
+            )
+            await asyncio.sleep(self._paused_until - now)
+            now = time.monotonic()
+
+        while True:
+            starts = self._request_starts
+            while starts and starts[0] <= now - self._window:
+                starts.popleft()
+            if not self._limit or len(starts) < self._limit:
+                break
+            delay = starts[0] + self._window - now
+            LOGGER.debug("Local rate limit reached, waiting %.1f seconds", delay)
+            await asyncio.sleep(delay)
+            now = time.monotonic()
+
+        self._request_starts.append(now)
+
+
 class EnergyTrackerApi:
     """Home Assistant wrapper for the Energy Tracker API client.
 
@@ -65,6 +495,94 @@ class EnergyTrackerApi:
         self._hass = hass
         self._token = token
         self._client = EnergyTrackerClient(access_token=token)
+        self._headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/json",
+        }
+        self._session: aiohttp.ClientSession | None = None
+        self._circuit = _CircuitBreaker(
+            failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+            recovery_time=CIRCUIT_RECOVERY_TIME,
+        )
+        self._limiter = _AdaptiveLimiter(
+            min_limit=CONCURRENCY_MIN,
+            max_limit=CONCURRENCY_MAX,
+            initial_limit=CONCURRENCY_INITIAL,
+            increase=CONCURRENCY_INCREASE,
+            decrease_factor=CONCURRENCY_DECREASE_FACTOR,
+            target_latency=CONCURRENCY_TARGET_LATENCY,
+            window=CONCURRENCY_LATENCY_WINDOW,
+        )
+        self._rate_limit = _RateLimitTracker(
+            low_watermark=RATE_LIMIT_LOW_WATERMARK,
+            window=RATE_LIMIT_WINDOW,
+        )
+        # Last device list per filter combination, kept for revalidation
+        self._device_cache: dict[tuple[tuple[str, str], ...], _CachedDevices] = {}
+        self._pending_readings: dict[
+            tuple[str, datetime, float, bool], asyncio.Task[None]
+        ] = {}
+
+    @callback
+    def _async_get_session(self) -> aiohttp.ClientSession:
+        """Return the dedicated HTTP session, creating it on first use.
+
+        The session carries this entry's headers and hooks and is handed to
+        the SDK client. Its connections come from a pool shared by all config
+        entries, so requests of every entry reuse warm keep-alive connections
+        to the Energy Tracker host.
+
+        Returns:
+            The cached aiohttp client session.
+        """
+        if self._session is None or self._session.closed:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_request_start.append(self._on_request_start)
+            trace_config.on_request_end.append(self._on_request_end)
+            self._session = aiohttp.ClientSession(
+                connector=_async_get_connector(self._hass),
+                connector_owner=False,
+                timeout=aiohttp.ClientTimeout(
+                    total=REQUEST_TIMEOUT, connect=REQUEST_CONNECT_TIMEOUT
+                ),
+                headers=self._headers,
+                json_serialize=json_dumps,
+                trace_configs=[trace_config],
+            )
+            # energy-tracker-api 1.0.0 takes no session argument. Its client
+            # reuses _session while that session is open, so every SDK request
+            # goes through this one.
+            self._client._session = self._session  # noqa: SLF001
+        return self._session
+
+    async def _on_request_start(
+        self,
+        session: aiohttp.ClientSession,
+        trace_config_ctx: object,
+        params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        """Attach the idempotency key of the meter reading being posted.
+
+        The SDK does not accept per-call headers, so the key is passed via a
+        context variable set around the create call.
+        """
+        if (key := _IDEMPOTENCY_KEY.get()) is not None:
+            params.headers["Idempotency-Key"] = key
+
+    async def _on_request_end(
+        self,
+        session: aiohttp.ClientSession,
+        trace_config_ctx: object,
+        params: aiohttp.TraceRequestEndParams,
+    ) -> None:
+        """Track the rate limit headers of every response."""
+        self._rate_limit.update(params.response.headers)
+
+    async def async_close(self) -> None:
+        """Close the dedicated HTTP session, leaving the shared pool open."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def send_meter_reading(
         self,
@@ -77,6 +595,12 @@ class EnergyTrackerApi:
     ) -> None:
         """Send a single meter reading to the Energy Tracker backend.
 
+        Identical readings that are submitted while a request for the same
+        reading is still in flight (e.g. several automations firing on the
+        same state change) are coalesced into that request and share its
+        result. While the backend is failing repeatedly, readings are
+        rejected immediately instead of waiting for another timeout.
+
         Args:
             source_entity_id: Entity ID for logging purposes.
             device_id: The standard device ID in Energy Tracker.
@@ -87,124 +611,248 @@ class EnergyTrackerApi:
         Raises:
             HomeAssistantError: If the API request fails.
         """
-        LOGGER.debug(
-            "Sending meter reading to API: device=%s, value=%.2f, timestamp=%s, source=%s",
-            device_id,
-            value,
-            timestamp.isoformat(),
-            source_entity_id,
-        )
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Sending meter reading to API: device=%s, value=%.2f, timestamp=%s, source=%s",
+                device_id,
+                value,
+                timestamp.isoformat(),
+                source_entity_id,
+            )
+
+        key = (device_id, timestamp, value, allow_rounding)
+        if (task := self._pending_readings.get(key)) is None:
+            allowed, probe = self._circuit.allow_request()
+            if not allowed:
+                LOGGER.warning(
+                    "Not sending meter reading for device %s, circuit breaker is open",
+                    device_id,
+                )
+                raise HomeAssistantError(
+                    translation_domain=DOMAIN,
+                    translation_key="circuit_open",
+                )
+            task = self._hass.async_create_task(
+                self._post_meter_reading(
+                    device_id=device_id,
+                    value=value,
+                    timestamp=timestamp,
+                    allow_rounding=allow_rounding,
+                    probe=probe,
+                ),
+                f"{DOMAIN} send meter reading {device_id}",
+            )
+            self._pending_readings[key] = task
+
+            def _request_done(task: asyncio.Task[None]) -> None:
+                self._pending_readings.pop(key, None)
+                # Only the probe may let the next call probe the backend
+                if probe:
+                    self._circuit.release()
+                # Mark the error as retrieved in case every caller was cancelled
+                if not task.cancelled():
+                    task.exception()
+
+            task.add_done_callback(_request_done)
+        else:
+            LOGGER.debug(
+                "Coalescing duplicate meter reading for device %s into pending request",
+                device_id,
+            )
+
+        await asyncio.shield(task)
 
+    async def _post_meter_reading(
+        self,
+        *,
+        device_id: str,
+        value: float,
+        timestamp: datetime,
+        allow_rounding: bool,
+        probe: bool,
+    ) -> None:
+        """Post a meter reading and translate API errors.
+
+        Args:
+            device_id: The Energy Tracker device ID.
+            value: The meter reading value.
+            timestamp: Timestamp for the reading.
+            allow_rounding: Allow rounding to match meter precision.
+            probe: Whether this request probes a half-open circuit breaker.
+
+        Raises:
+            HomeAssistantError: If the API request fails.
+        """
         meter_reading = CreateMeterReadingDto(
             value=value,
             timestamp=timestamp,
         )
 
+        self._async_get_session()
+
         try:
-            await self._client.meter_readings.create(
+            await self._create_with_retry(
                 device_id=device_id,
                 meter_reading=meter_reading,
                 allow_rounding=allow_rounding,
+                idempotency_key=_idempotency_key(device_id, timestamp, value),
             )
-            LOGGER.info(
-                "Successfully sent meter reading: device=%s, value=%.2f",
-                device_id,
-                value,
-            )
-
-        except ValidationError as err:
-            # HTTP 400 - Bad Request
-            LOGGER.warning("Validation error: %s", err)
-            msg = "; ".join(err.api_message) if err.api_message else "Invalid input"
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="bad_request",
-                translation_placeholders={"error": msg},
+        except EnergyTrackerAPIError as err:
+            if isinstance(err, (TimeoutError, NetworkError)) or _is_server_error(err):
+                self._circuit.record_failure()
+            elif probe:
+                # The backend answered, so it is reachable again
+                self._circuit.record_success()
+            if isinstance(err, ConflictError):
+                self._device_cache.clear()
+            raise _translate_error(
+                err, "sending meter reading", fallback="Invalid input"
             ) from err
-
-        except AuthenticationError as err:
-            # HTTP 401 - Unauthorized
-            LOGGER.error("Authentication failed: %s", err)
+        except Exception as err:
+            # Unexpected errors
+            LOGGER.exception("Unexpected error")
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
-                translation_key="auth_failed",
+                translation_key="unknown_error",
+                translation_placeholders={"error": str(err)},
             ) from err
 
-        except ForbiddenError as err:
-            # HTTP 403 - Forbidden
-            LOGGER.error("Access forbidden: %s", err)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="auth_failed",
-            ) from err
+        self._circuit.record_success()
+        # The device's last update time has changed
+        self._device_cache.clear()
+        LOGGER.info(
+            "Successfully sent meter reading: device=%s, value=%.2f",
+            device_id,
+            value,
+        )
 
-        except ResourceNotFoundError as err:
-            # HTTP 404 - Not Found
-            LOGGER.warning("Device not found: %s", err)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="device_not_found",
-            ) from err
+    async def _create_with_retry(
+        self,
+        *,
+        device_id: str,
+        meter_reading: CreateMeterReadingDto,
+        allow_rounding: bool,
+        idempotency_key: str,
+    ) -> None:
+        """Create a meter reading, retrying transient server-side failures.
 
-        except ConflictError as err:
-            # HTTP 409 - Conflict
-            LOGGER.warning("Conflict: %s", err)
-            msg = "; ".join(err.api_message) if err.api_message else str(err)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="conflict",
-                translation_placeholders={"error": msg},
-            ) from err
+        A rate limit with a short Retry-After is waited out once, and server
+        errors (HTTP 5xx) are retried with exponential backoff and full
+        jitter. Client errors (HTTP 4xx) are never retried. Each attempt
+        waits for a slot from the adaptive limiter, so a burst of readings
+        queues up locally instead of overloading the backend; slots are not
+        held while backing off. Attempts are paced by the rate limit the
+        backend advertises in its response headers.
 
-        except RateLimitError as err:
-            # HTTP 429 - Rate Limit
-            LOGGER.warning("Rate limit exceeded: %s", err)
+        Every attempt carries the same Idempotency-Key header so a backend
+        that honors it does not book the reading twice. A conflict is raised
+        even on a retry: it only says that some reading exists for the
+        timestamp, not that it is the one this call sent.
 
-            if err.retry_after:
-                raise HomeAssistantError(
-                    translation_domain=DOMAIN,
-                    translation_key="rate_limit",
-                    translation_placeholders={"retry_after": str(err.retry_after)},
-                ) from err
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="rate_limit_no_time",
-            ) from err
+        Raises:
+            EnergyTrackerAPIError: If the request still fails after retrying.
+        """
+        attempt = 0
+        rate_limit_retried = False
+        context_token = _IDEMPOTENCY_KEY.set(idempotency_key)
 
-        except TimeoutError as err:
-            # Request timeout
-            LOGGER.error("Request timeout: %s", err)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="timeout",
-            ) from err
+        try:
+            while True:
+                await self._rate_limit.wait()
+                try:
+                    async with self._limiter.slot():
+                        await self._client.meter_readings.create(
+                            device_id=device_id,
+                            meter_reading=meter_reading,
+                            allow_rounding=allow_rounding,
+                        )
+                except RateLimitError as err:
+                    if (
+                        rate_limit_retried
+                        or err.retry_after is None
+                        or err.retry_after > RATE_LIMIT_MAX_RETRY_AFTER
+                    ):
+                        raise
+                    rate_limit_retried = True
+                    delay = float(err.retry_after)
+                except EnergyTrackerAPIError as err:
+                    if not _is_server_error(err) or attempt >= SERVER_ERROR_MAX_RETRIES:
+                        raise
+                    delay = _backoff_delay(attempt)
+                    attempt += 1
+                else:
+                    return
+
+                LOGGER.debug(
+                    "Retrying meter reading for device %s in %.1f seconds",
+                    device_id,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+        finally:
+            _IDEMPOTENCY_KEY.reset(context_token)
 
-        except NetworkError as err:
-            # Network/connection errors
-            LOGGER.error("Network error: %s", err)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="network_error",
-            ) from err
+    async def _get_json(self, endpoint: str, params: dict[str, str] | None) -> Any:
+        """Issue a GET request and decode its JSON body.
 
-        except EnergyTrackerAPIError as err:
-            # Other API errors
-            LOGGER.error("API error: %s", err)
-            msg = "; ".join(err.api_message) if err.api_message else str(err)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="server_error",
-                translation_placeholders={"error": msg},
-            ) from err
+        Raises:
+            EnergyTrackerAPIError: If the request still fails after retrying.
+        """
+        response = await self._get(endpoint, params)
+        return json_loads(await response.read())
 
-        except Exception as err:
-            # Unexpected errors
-            LOGGER.exception("Unexpected error")
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="unknown_error",
-                translation_placeholders={"error": str(err)},
-            ) from err
+    async def _get(
+        self,
+        endpoint: str,
+        params: dict[str, str] | None,
+        headers: dict[str, str] | None = None,
+    ) -> aiohttp.ClientResponse:
+        """Issue a GET request and return the response with its body read.
+
+        Network errors, timeouts and server errors (HTTP 5xx) are retried with
+        exponential backoff and full jitter. A rate limit is retried once,
+        waiting at least its Retry-After, unless that is too long to wait
+        for. Other errors are raised immediately. Like meter readings, each
+        attempt waits for a slot from the adaptive limiter, so a burst of
+        per-device fetches is held back while the backend is slow, and is
+        paced by the rate limit the backend advertises.
+
+        Raises:
+            EnergyTrackerAPIError: If the request still fails after retrying.
+        """
+        self._async_get_session()
+        attempt = 0
+        rate_limit_retried = False
+
+        while True:
+            await self._rate_limit.wait()
+            try:
+                async with self._limiter.slot():
+                    return await self._client._make_request(
+                        method="GET",
+                        endpoint=endpoint,
+                        params=params,
+                        headers=headers,
+                    )
+            except RateLimitError as err:
+                if rate_limit_retried or (
+                    err.retry_after is not None
+                    and err.retry_after > RATE_LIMIT_MAX_RETRY_AFTER
+                ):
+                    raise
+                rate_limit_retried = True
+                delay = max(_backoff_delay(attempt), float(err.retry_after or 0))
+            except EnergyTrackerAPIError as err:
+                transient = isinstance(
+                    err, (NetworkError, TimeoutError)
+                ) or _is_server_error(err)
+                if not transient or attempt >= GET_MAX_RETRIES:
+                    raise
+                delay = _backoff_delay(attempt)
+                attempt += 1
+
+            LOGGER.debug("Retrying GET %s in %.1f seconds", endpoint, delay)
+            await asyncio.sleep(delay)
 
     async def get_devices(
         self,
@@ -216,6 +864,12 @@ class EnergyTrackerApi:
     ) -> list[DeviceSummary]:
         """Get list of standard measuring devices.
 
+        Every call asks the API, so the device update times the coordinator
+        relies on are never stale. The last list per filter combination is
+        kept with the ETag and Last-Modified validators it was served with,
+        so an unchanged list costs a bodiless 304 response instead of a
+        download. Sending a reading drops the kept lists.
+
         Args:
             name: Filter by device name (partial match).
             folder_path: Filter devices in or under specified folder path.
@@ -228,28 +882,36 @@ class EnergyTrackerApi:
         Raises:
             HomeAssistantError: If the API request fails.
         """
-        LOGGER.info("Fetching devices from Energy Tracker API")
+        params = {
+            key: value
+            for key, value in (
+                ("name", name),
+                ("folderPath", folder_path),
+                ("updatedAfter", updated_after),
+                ("updatedBefore", updated_before),
+            )
+            if value
+        }
 
-        endpoint = "/v1/devices/standard"
-        params: dict[str, str] = {}
+        LOGGER.info("Fetching devices from Energy Tracker API")
 
-        if name:
-            params["name"] = name
-        if folder_path:
-            params["folderPath"] = folder_path
-        if updated_after:
-            params["updatedAfter"] = updated_after
-        if updated_before:
-            params["updatedBefore"] = updated_before
+        cache_key = tuple(sorted(params.items()))
+        headers: dict[str, str] = {}
+        if (cached := self._device_cache.get(cache_key)) is not None:
+            if cached.etag is not None:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified is not None:
+                headers["If-Modified-Since"] = cached.last_modified
 
         try:
-            response = await self._client._make_request(
-                method="GET",
-                endpoint=endpoint,
-                params=params or None,
+            response = await self._get(
+                _DEVICES_ENDPOINT, params or None, headers or None
             )
+            if cached is not None and response.status == 304:
+                LOGGER.debug("Device list not modified, reusing cached devices")
+                return list(cached.devices)
 
-            data = await response.json()
+            data = json_loads(await response.read())
             devices = [
                 DeviceSummary(
                     id=device["id"],
@@ -261,38 +923,15 @@ class EnergyTrackerApi:
             ]
 
             LOGGER.info("Successfully fetched %d devices from API", len(devices))
-            return devices
-
-        except (AuthenticationError, ForbiddenError) as err:
-            LOGGER.error("Authentication error fetching devices: %s", err)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="auth_failed",
-            ) from err
-
-        except ValidationError as err:
-            LOGGER.warning("Validation error fetching devices: %s", err)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="bad_request",
-                translation_placeholders={
-                    "error": "; ".join(err.api_message) if err.api_message else str(err)
-                },
-            ) from err
-
-        except RateLimitError as err:
-            LOGGER.warning("Rate limit exceeded fetching devices: %s", err)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="rate_limit_no_time",
-            ) from err
+            self._device_cache[cache_key] = _CachedDevices(
+                devices=devices,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+            return list(devices)
 
-        except (NetworkError, TimeoutError) as err:
-            LOGGER.error("Network error fetching devices: %s", err)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="network_error",
-            ) from err
+        except EnergyTrackerAPIError as err:
+            raise _translate_error(err, "fetching devices") from err
 
         except Exception as err:
             LOGGER.exception("Unexpected error fetching devices")
@@ -329,23 +968,19 @@ class EnergyTrackerApi:
         LOGGER.debug("Fetching meter readings for device %s", device_id)
 
         endpoint = f"/v3/devices/standard/{device_id}/meter-readings"
-        params: dict[str, str] = {"sort": sort}
-
-        if meter_id:
-            params["meterId"] = meter_id
-        if from_timestamp:
-            params["from"] = from_timestamp
-        if to_timestamp:
-            params["to"] = to_timestamp
-
-        try:
-            response = await self._client._make_request(
-                method="GET",
-                endpoint=endpoint,
-                params=params,
+        params = {
+            key: value
+            for key, value in (
+                ("sort", sort),
+                ("meterId", meter_id),
+                ("from", from_timestamp),
+                ("to", to_timestamp),
             )
+            if value
+        }
 
-            data = await response.json()
+        try:
+            data = await self._get_json(endpoint, params)
             readings = [
                 MeterReading(
                     timestamp=reading["timestamp"],
@@ -365,35 +1000,9 @@ class EnergyTrackerApi:
             )
             return readings
 
-        except ResourceNotFoundError as err:
-            LOGGER.warning("Device %s not found: %s", device_id, err)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="device_not_found",
-            ) from err
-
-        except (AuthenticationError, ForbiddenError) as err:
-            LOGGER.error("Authentication error fetching readings: %s", err)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="auth_failed",
-            ) from err
-
-        except ValidationError as err:
-            LOGGER.warning("Validation error fetching readings: %s", err)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="bad_request",
-                translation_placeholders={
-                    "error": "; ".join(err.api_message) if err.api_message else str(err)
-                },
-            ) from err
-
-        except (NetworkError, TimeoutError) as err:
-            LOGGER.error("Network error fetching readings: %s", err)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="network_error",
+        except EnergyTrackerAPIError as err:
+            raise _translate_error(
+                err, f"fetching readings for device {device_id}"
             ) from err
 
         except Exception as err:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import string
 from typing import Any
 
 from homeassistant import config_entries
@@ -19,6 +20,26 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+STEP_RECONFIGURE_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_API_TOKEN): cv.string,
+    }
+)
+
+
+# Characters allowed in a bearer token (RFC 6750)
+_TOKEN_CHARS = frozenset(string.ascii_letters + string.digits + "-._~+/=")
+
+
+def _is_valid_token(token: str) -> bool:
+    """Return whether a token can be a bearer token at all.
+
+    Rejects an empty token or one with characters outside _TOKEN_CHARS, such
+    as whitespace inside the token, before any request is made. The length is
+    not checked, so a truncated token is only caught by the backend.
+    """
+    return bool(token) and all(char in _TOKEN_CHARS for char in token)
+
 
 class EnergyTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
     """Config flow handler for the Energy Tracker integration.
@@ -31,18 +52,26 @@ class EnergyTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type
         user_input: dict[str, Any] | None = None,
     ) -> FlowResult:
         """Handle the initial step."""
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            await self.async_set_unique_id(user_input[CONF_API_TOKEN])
-            self._abort_if_unique_id_configured()
+            token = user_input[CONF_API_TOKEN].strip()
+            if _is_valid_token(token):
+                await self.async_set_unique_id(token)
+                self._abort_if_unique_id_configured()
 
-            return self.async_create_entry(
-                title=user_input[CONF_NAME],
-                data={CONF_API_TOKEN: user_input[CONF_API_TOKEN]},
-            )
+                return self.async_create_entry(
+                    title=user_input[CONF_NAME],
+                    data={CONF_API_TOKEN: token},
+                )
+            errors[CONF_API_TOKEN] = "invalid_token"
 
         return self.async_show_form(
             step_id="user",
-            data_schema=STEP_USER_DATA_SCHEMA,
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_USER_DATA_SCHEMA, user_input or {}
+            ),
+            errors=errors,
         )
 
     async def async_step_reconfigure(
@@ -51,28 +80,28 @@ class EnergyTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type
     ) -> FlowResult:
         """Handle reconfiguration of the integration."""
         entry = self._get_reconfigure_entry()
+        errors: dict[str, str] = {}
 
         if user_input is not None:
-            if user_input[CONF_API_TOKEN] != entry.data[CONF_API_TOKEN]:
-                await self.async_set_unique_id(user_input[CONF_API_TOKEN])
-                self._abort_if_unique_id_configured()
-                self.hass.config_entries.async_update_entry(
-                    entry, unique_id=user_input[CONF_API_TOKEN]
-                )
+            token = user_input[CONF_API_TOKEN].strip()
+            if _is_valid_token(token):
+                if token != entry.data[CONF_API_TOKEN]:
+                    await self.async_set_unique_id(token)
+                    self._abort_if_unique_id_configured()
+                    self.hass.config_entries.async_update_entry(entry, unique_id=token)
 
-            return self.async_update_reload_and_abort(
-                entry,
-                data={CONF_API_TOKEN: user_input[CONF_API_TOKEN]},
-                reason="reconfigure_successful",
-            )
+                return self.async_update_reload_and_abort(
+                    entry,
+                    data={CONF_API_TOKEN: token},
+                    reason="reconfigure_successful",
+                )
+            errors[CONF_API_TOKEN] = "invalid_token"
 
         return self.async_show_form(
             step_id="reconfigure",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_API_TOKEN, default=entry.data[CONF_API_TOKEN]
-                    ): cv.string,
-                }
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_RECONFIGURE_DATA_SCHEMA,
+                user_input or {CONF_API_TOKEN: entry.data[CONF_API_TOKEN]},
             ),
+            errors=errors,
         )
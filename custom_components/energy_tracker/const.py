@@ -10,7 +10,36 @@ DOMAIN = "energy_tracker"
 
 CONF_API_TOKEN = "api_token"
 
-DEFAULT_API_BASE_URL = "https://public-api.energy-tracker.best-ios-apps.de"
+# Total timeout for a single API request, in seconds
+REQUEST_TIMEOUT = 10
+# Timeout for acquiring a connection to the API host, in seconds
+REQUEST_CONNECT_TIMEOUT = 5
+
+# Adaptive (AIMD) limit on concurrent requests to the Energy Tracker host
+CONCURRENCY_MIN = 2
+CONCURRENCY_MAX = 50
+CONCURRENCY_INITIAL = 20
+CONCURRENCY_INCREASE = 0.5
+CONCURRENCY_DECREASE_FACTOR = 0.5
+# Mean latency (seconds) over the last requests above which the limit shrinks
+CONCURRENCY_TARGET_LATENCY = 1.0
+CONCURRENCY_LATENCY_WINDOW = 20
+
+# Retry behaviour for transient API errors
+SERVER_ERROR_MAX_RETRIES = 2
+GET_MAX_RETRIES = 2
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_MAX = 30.0
+# Longest Retry-After (seconds) that is waited out instead of failing
+RATE_LIMIT_MAX_RETRY_AFTER = 5
+# Pause new requests when less than this share of the rate limit remains
+RATE_LIMIT_LOW_WATERMARK = 0.1
+# Length (seconds) of the window the advertised rate limit applies to
+RATE_LIMIT_WINDOW = 60
+
+# Circuit breaker: consecutive failures before opening, and seconds to stay open
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RECOVERY_TIME = 30.0
 
 SERVICE_SEND_METER_READING = "send_meter_reading"
 
@@ -19,3 +48,9 @@ PLATFORMS: list[Platform] = [Platform.SENSOR]
 
 # Update interval for sensor data
 DEFAULT_SCAN_INTERVAL = timedelta(minutes=15)
+# Upper bound of the random delay added to each entry's update interval so
+# that several config entries do not refresh at the same moment
+SCAN_INTERVAL_JITTER = timedelta(minutes=1)
+
+# Maximum number of devices whose readings are fetched concurrently
+MAX_PARALLEL_FETCHES = 10
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
 from datetime import timedelta
 import logging
+import random
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -13,7 +16,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -24,12 +27,25 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from .api import DeviceSummary, EnergyTrackerApi, MeterReading
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    MAX_PARALLEL_FETCHES,
+    SCAN_INTERVAL_JITTER,
+)
 
 LOGGER = logging.getLogger(__name__)
 
 
-class EnergyTrackerDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+@dataclass(slots=True, frozen=True)
+class DeviceState:
+    """State of a single device as fetched by the coordinator."""
+
+    device: DeviceSummary
+    latest_reading: MeterReading | None
+
+
+class EnergyTrackerDataUpdateCoordinator(DataUpdateCoordinator[dict[str, DeviceState]]):
     """Class to manage fetching Energy Tracker data."""
 
     def __init__(
@@ -46,8 +62,11 @@ class EnergyTrackerDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=update_interval,
         )
         self.api = api
+        self.fetch_semaphore = asyncio.Semaphore(MAX_PARALLEL_FETCHES)
+        # Device ID -> last update time of the device when its readings were fetched
+        self._last_seen: dict[str, str] = {}
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_update_data(self) -> dict[str, DeviceState]:
         """Fetch data from API."""
         try:
             LOGGER.debug("Starting data synchronization with Energy Tracker API")
@@ -56,42 +75,13 @@ class EnergyTrackerDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             devices = await self.api.get_devices()
             LOGGER.info("Synchronized %d devices from Energy Tracker API", len(devices))
 
-            # Fetch latest reading for each device
-            device_data: dict[str, dict[str, Any]] = {}
-            for device in devices:
-                try:
-                    readings = await self.api.get_meter_readings(device.id, sort="desc")
-                    latest_reading = readings[0] if readings else None
-
-                    device_data[device.id] = {
-                        "device": device,
-                        "latest_reading": latest_reading,
-                    }
-
-                    if latest_reading:
-                        LOGGER.debug(
-                            "Device '%s' (%s): Latest reading %.2f at %s",
-                            device.name,
-                            device.id,
-                            float(latest_reading.value),
-                            latest_reading.timestamp,
-                        )
-                    else:
-                        LOGGER.debug(
-                            "Device '%s' (%s): No readings available",
-                            device.name,
-                            device.id,
-                        )
-
-                except HomeAssistantError as err:
-                    LOGGER.warning(
-                        "Failed to fetch readings for device %s: %s", device.id, err
-                    )
-                    # Still include device even if readings fail
-                    device_data[device.id] = {
-                        "device": device,
-                        "latest_reading": None,
-                    }
+            # Fetch latest reading for each device concurrently
+            results = await asyncio.gather(
+                *(self._async_fetch_device(device) for device in devices)
+            )
+            device_data: dict[str, DeviceState] = {
+                device.id: data for device, data in zip(devices, results, strict=True)
+            }
 
             LOGGER.info("Data synchronization completed successfully")
             return device_data
@@ -100,6 +90,57 @@ class EnergyTrackerDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             LOGGER.error("Failed to synchronize data from Energy Tracker API: %s", err)
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
+    async def _async_fetch_device(self, device: DeviceSummary) -> DeviceState:
+        """Fetch the latest reading of a single device.
+
+        Devices whose last update time has not changed since their readings
+        were last fetched keep their previous reading without a request.
+        Otherwise, after the first refresh only readings from the previously
+        known latest reading onwards are requested, instead of the full
+        history. If that reading is gone, the full history is fetched again.
+        """
+        previous: MeterReading | None = None
+        if self.data and device.id in self.data:
+            previous = self.data[device.id].latest_reading
+            if self._last_seen.get(device.id) == device.last_updated_at:
+                return DeviceState(device=device, latest_reading=previous)
+
+        try:
+            async with self.fetch_semaphore:
+                readings = await self.api.get_meter_readings(
+                    device.id,
+                    from_timestamp=previous.timestamp if previous else None,
+                    sort="desc",
+                )
+                if not readings and previous:
+                    readings = await self.api.get_meter_readings(device.id, sort="desc")
+        except HomeAssistantError as err:
+            LOGGER.warning("Failed to fetch readings for device %s: %s", device.id, err)
+            self._last_seen.pop(device.id, None)
+            # Still include device even if readings fail
+            return DeviceState(device=device, latest_reading=None)
+
+        self._last_seen[device.id] = device.last_updated_at
+        latest_reading = readings[0] if readings else None
+
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            if latest_reading:
+                LOGGER.debug(
+                    "Device '%s' (%s): Latest reading %s at %s",
+                    device.name,
+                    device.id,
+                    latest_reading.value,
+                    latest_reading.timestamp,
+                )
+            else:
+                LOGGER.debug(
+                    "Device '%s' (%s): No readings available",
+                    device.name,
+                    device.id,
+                )
+
+        return DeviceState(device=device, latest_reading=latest_reading)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -111,24 +152,24 @@ async def async_setup_entry(
         "Setting up Energy Tracker sensor platform for entry %s", entry.entry_id
     )
 
-    token = entry.runtime_data
-    api = EnergyTrackerApi(hass=hass, token=token)
+    api: EnergyTrackerApi = entry.runtime_data
 
-    # Create coordinator
+    # Create coordinator, offsetting its refreshes from those of other entries
     coordinator = EnergyTrackerDataUpdateCoordinator(
         hass=hass,
         api=api,
-        update_interval=DEFAULT_SCAN_INTERVAL,
+        update_interval=DEFAULT_SCAN_INTERVAL
+        + random.uniform(0, 1) * SCAN_INTERVAL_JITTER,
     )
 
     # Fetch initial data
     LOGGER.debug("Performing initial data fetch")
     await coordinator.async_config_entry_first_refresh()
 
-    # Create sensors for each device
+    # Create sensors for each device, sharing one DeviceInfo per device
     entities: list[SensorEntity] = []
-    for device_id, data in coordinator.data.items():
-        device: DeviceSummary = data["device"]
+    for device_id, state in coordinator.data.items():
+        device = state.device
 
         LOGGER.info(
             "Creating sensors for device '%s' (ID: %s, Folder: %s)",
@@ -137,14 +178,11 @@ async def async_setup_entry(
             device.folder_path,
         )
 
-        # Create status sensor
-        entities.append(EnergyTrackerDeviceStatusSensor(coordinator, device_id, entry))
-
-        # Create latest reading sensor
-        entities.append(EnergyTrackerLatestReadingSensor(coordinator, device_id, entry))
-
-        # Create last updated sensor
-        entities.append(EnergyTrackerLastUpdatedSensor(coordinator, device_id, entry))
+        device_info = _device_info(device)
+        entities.extend(
+            sensor_class(coordinator, device_id, device_info)
+            for sensor_class in SENSOR_CLASSES
+        )
 
     LOGGER.info(
         "Created %d sensors for %d devices",
@@ -155,161 +193,151 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
+def _device_info(device: DeviceSummary) -> DeviceInfo:
+    """Return the device registry info for an Energy Tracker device."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, device.id)},
+        name=device.name,
+        manufacturer="Energy Tracker",
+        model="Standard Measuring Device",
+        configuration_url="https://www.energy-tracker.best-ios-apps.de",
+    )
+
+
 class EnergyTrackerSensorBase(
     CoordinatorEntity[EnergyTrackerDataUpdateCoordinator], SensorEntity
 ):
     """Base class for Energy Tracker sensors."""
 
     _attr_has_entity_name = True
+    _unique_id_suffix: str
 
     def __init__(
         self,
         coordinator: EnergyTrackerDataUpdateCoordinator,
         device_id: str,
-        entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._device_id = device_id
-        self._entry = entry
-
-        device: DeviceSummary = coordinator.data[device_id]["device"]
+        self._attr_unique_id = f"{device_id}_{self._unique_id_suffix}"
 
         # Device info for grouping
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=device.name,
-            manufacturer="Energy Tracker",
-            model="Standard Measuring Device",
-            configuration_url="https://www.energy-tracker.best-ios-apps.de",
-        )
+        self._attr_device_info = device_info
+
+        self._update_from_coordinator()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the state once per coordinator update."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """Derive the native value and attributes from the coordinator data."""
 
     @property
-    def device_data(self) -> dict[str, Any]:
+    def device_data(self) -> DeviceState:
         """Return the device data from coordinator."""
         return self.coordinator.data[self._device_id]
 
     @property
     def device(self) -> DeviceSummary:
         """Return the device summary."""
-        return self.device_data["device"]
+        return self.device_data.device
 
     @property
     def latest_reading(self) -> MeterReading | None:
         """Return the latest meter reading."""
-        return self.device_data.get("latest_reading")
+        return self.device_data.latest_reading
 
 
 class EnergyTrackerDeviceStatusSensor(EnergyTrackerSensorBase):
     """Sensor for device status."""
 
+    _attr_translation_key = "device_status"
+    _unique_id_suffix = "status"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:information"
 
-    def __init__(
-        self,
-        coordinator: EnergyTrackerDataUpdateCoordinator,
-        device_id: str,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, device_id, entry)
-        self._attr_unique_id = f"{device_id}_status"
-        self._attr_translation_key = "device_status"
-
-    @property
-    def native_value(self) -> str:
-        """Return the status of the device."""
-        if self.latest_reading:
-            return "active"
-        return "no_readings"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        attrs = {
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """Derive the status and attributes from the coordinator data."""
+        latest_reading = self.latest_reading
+        device = self.device
+        attrs: dict[str, Any] = {
             "device_id": self._device_id,
-            "folder_path": self.device.folder_path,
-            "last_updated_at": self.device.last_updated_at,
+            "folder_path": device.folder_path,
+            "last_updated_at": device.last_updated_at,
         }
 
-        if self.latest_reading:
-            attrs["meter_id"] = self.latest_reading.meter_id
-            if self.latest_reading.meter_number:
-                attrs["meter_number"] = self.latest_reading.meter_number
+        if latest_reading:
+            attrs["meter_id"] = latest_reading.meter_id
+            if latest_reading.meter_number:
+                attrs["meter_number"] = latest_reading.meter_number
 
-        return attrs
+        self._attr_native_value = "active" if latest_reading else "no_readings"
+        self._attr_extra_state_attributes = attrs
 
 
 class EnergyTrackerLatestReadingSensor(EnergyTrackerSensorBase):
     """Sensor for latest meter reading."""
 
+    _attr_translation_key = "latest_reading"
+    _unique_id_suffix = "latest_reading"
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_native_unit_of_measurement = "kWh"
     _attr_suggested_display_precision = 2
 
-    def __init__(
-        self,
-        coordinator: EnergyTrackerDataUpdateCoordinator,
-        device_id: str,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, device_id, entry)
-        self._attr_unique_id = f"{device_id}_latest_reading"
-        self._attr_translation_key = "latest_reading"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the latest reading value."""
-        if self.latest_reading:
-            try:
-                return float(self.latest_reading.value)
-            except (ValueError, TypeError):
-                LOGGER.warning(
-                    "Invalid reading value for device %s: %s",
-                    self._device_id,
-                    self.latest_reading.value,
-                )
-                return None
-        return None
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """Derive the reading value and attributes from the coordinator data."""
+        latest_reading = self.latest_reading
+        if not latest_reading:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = None
+            return
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return additional attributes."""
-        if not self.latest_reading:
-            return None
+        try:
+            self._attr_native_value = float(latest_reading.value)
+        except (ValueError, TypeError):
+            LOGGER.warning(
+                "Invalid reading value for device %s: %s",
+                self._device_id,
+                latest_reading.value,
+            )
+            self._attr_native_value = None
 
         attrs: dict[str, Any] = {
-            "timestamp": self.latest_reading.timestamp,
-            "rollover_offset": self.latest_reading.rollover_offset,
+            "timestamp": latest_reading.timestamp,
+            "rollover_offset": latest_reading.rollover_offset,
         }
 
-        if self.latest_reading.note:
-            attrs["note"] = self.latest_reading.note
+        if latest_reading.note:
+            attrs["note"] = latest_reading.note
 
-        return attrs
+        self._attr_extra_state_attributes = attrs
 
 
 class EnergyTrackerLastUpdatedSensor(EnergyTrackerSensorBase):
     """Sensor for last update timestamp."""
 
+    _attr_translation_key = "last_updated"
+    _unique_id_suffix = "last_updated"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_device_class = SensorDeviceClass.TIMESTAMP
 
-    def __init__(
-        self,
-        coordinator: EnergyTrackerDataUpdateCoordinator,
-        device_id: str,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, device_id, entry)
-        self._attr_unique_id = f"{device_id}_last_updated"
-        self._attr_translation_key = "last_updated"
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """Derive the last updated timestamp from the coordinator data."""
+        self._attr_native_value = self.device.last_updated_at
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the last updated timestamp."""
-        return self.device.last_updated_at
+
+SENSOR_CLASSES: tuple[type[EnergyTrackerSensorBase], ...] = (
+    EnergyTrackerDeviceStatusSensor,
+    EnergyTrackerLatestReadingSensor,
+    EnergyTrackerLastUpdatedSensor,
+)
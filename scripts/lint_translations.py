@@ -13,12 +13,17 @@ Checks performed:
 
 from __future__ import annotations
 
-import json
 import re
 import sys
 from pathlib import Path
 from typing import Any
 
+try:
+    # orjson comes with Home Assistant and parses bytes directly
+    from orjson import JSONDecodeError, loads as json_loads
+except ImportError:
+    from json import JSONDecodeError, loads as json_loads  # type: ignore[assignment]
+
 # ANSI colors for terminal output
 COLORS = {
     "red": "\033[31m",
@@ -31,62 +36,96 @@ COLORS = {
     "bold": "\033[1m",
 }
 
+# Line prefixes of the log helpers, rendered once
+ERROR_PREFIX = f"{COLORS['red']}✖ "
+WARN_PREFIX = f"{COLORS['yellow']}⚠ "
+SUCCESS_PREFIX = f"{COLORS['green']}✓ "
+INFO_PREFIX = f"{COLORS['cyan']}ℹ "
+HEADER_PREFIX = f"\n{COLORS['bold']}{COLORS['blue']}"
+RESET = COLORS["reset"]
+
+# Pattern to match translation_key="..." or translation_key='...', applied to
+# raw file bytes so the files never need decoding
+TRANSLATION_KEY_PATTERN = re.compile(rb'translation_key\s*=\s*["\']([^"\']+)["\']')
+
+# Pattern to match {placeholder_name}
+PLACEHOLDER_PATTERN = re.compile(r"\{([^}]+)\}")
+
+NO_PLACEHOLDERS: frozenset[str] = frozenset()
+
 
 def log_error(msg: str) -> None:
     """Log an error message."""
-    print(f"{COLORS['red']}✖ {msg}{COLORS['reset']}")
+    print(f"{ERROR_PREFIX}{msg}{RESET}")
 
 
 def log_warn(msg: str) -> None:
     """Log a warning message."""
-    print(f"{COLORS['yellow']}⚠ {msg}{COLORS['reset']}")
+    print(f"{WARN_PREFIX}{msg}{RESET}")
 
 
 def log_success(msg: str) -> None:
     """Log a success message."""
-    print(f"{COLORS['green']}✓ {msg}{COLORS['reset']}")
+    print(f"{SUCCESS_PREFIX}{msg}{RESET}")
 
 
 def log_info(msg: str) -> None:
     """Log an info message."""
-    print(f"{COLORS['cyan']}ℹ {msg}{COLORS['reset']}")
+    print(f"{INFO_PREFIX}{msg}{RESET}")
 
 
 def log_header(msg: str) -> None:
     """Log a header message."""
-    print(f"\n{COLORS['bold']}{COLORS['blue']}{msg}{COLORS['reset']}\n")
+    print(f"{HEADER_PREFIX}{msg}{RESET}\n")
+
+
+def write_lines(lines: list[str]) -> None:
+    """Write report lines to stdout with a single write call."""
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
 
 
 def flatten_json(data: dict[str, Any], prefix: str = "") -> dict[str, str]:
-    """Flatten a nested JSON structure into dot-notation keys."""
+    """Flatten a nested JSON structure into dot-notation keys.
+
+    Walks the structure depth-first with an explicit stack of item
+    iterators, so keys keep their document order.
+    """
     result: dict[str, str] = {}
+    stack = [(prefix, iter(data.items()))]
 
-    for key, value in data.items():
-        full_key = f"{prefix}.{key}" if prefix else key
+    while stack:
+        current_prefix, items = stack[-1]
+        for key, value in items:
+            full_key = current_prefix + "." + key if current_prefix else key
 
-        if isinstance(value, dict):
-            result.update(flatten_json(value, full_key))
-        elif isinstance(value, str):
-            result[full_key] = value
+            if isinstance(value, dict):
+                stack.append((full_key, iter(value.items())))
+                break
+            if isinstance(value, str):
+                result[full_key] = value
+        else:
+            stack.pop()
 
     return result
 
 
-def extract_placeholders(value: str) -> set[str]:
+def extract_placeholders(value: str) -> frozenset[str]:
     """Extract placeholder names from a translation string.
 
-    Placeholders are in the format {placeholder_name}.
+    Placeholders are in the format {placeholder_name}. Most strings have
+    none, so those skip the regex.
     """
-    return set(re.findall(r"\{([^}]+)\}", value))
+    if "{" not in value:
+        return NO_PLACEHOLDERS
+    return frozenset(PLACEHOLDER_PATTERN.findall(value))
 
 
 def load_translation_file(file_path: Path) -> dict[str, str] | None:
     """Load and flatten a translation JSON file."""
     try:
-        with open(file_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = json_loads(file_path.read_bytes())
         return flatten_json(data)
-    except json.JSONDecodeError as e:
+    except JSONDecodeError as e:
         log_error(f"Invalid JSON in {file_path}: {e}")
         return None
     except OSError as e:
@@ -103,90 +142,90 @@ def extract_translation_keys_from_python(
     """
     used_keys: dict[str, list[dict[str, Any]]] = {}
 
-    # Pattern to match translation_key="..." or translation_key='...'
-    pattern = re.compile(r'translation_key\s*=\s*["\']([^"\']+)["\']')
-
-    py_files = list(root_dir.rglob("*.py"))
+    py_files: list[Path] = []
+    for dir_path, dir_names, file_names in root_dir.walk():
+        # Skip pycache directories without descending into them
+        dir_names[:] = [name for name in dir_names if name != "__pycache__"]
+        py_files.extend(
+            dir_path / name
+            for name in file_names
+            # Skip test files
+            if name.endswith(".py") and "test_" not in name
+        )
 
     for py_file in py_files:
-        # Skip test files and pycache
-        if "__pycache__" in str(py_file) or "test_" in py_file.name:
-            continue
-
         try:
-            content = py_file.read_text(encoding="utf-8")
+            raw = py_file.read_bytes()
         except OSError:
             continue
 
-        for line_num, line in enumerate(content.split("\n"), start=1):
-            for match in pattern.finditer(line):
-                key = match.group(1)
-                if key not in used_keys:
-                    used_keys[key] = []
-                used_keys[key].append(
-                    {
-                        "file": str(py_file),
-                        "line": line_num,
-                    }
-                )
-
-    return used_keys
-
-
-def check_missing_translations(
-    strings: dict[str, str],
-    translations: dict[str, dict[str, str]],
-) -> list[dict[str, Any]]:
-    """Check for keys missing in translation files.
-
-    Returns a list of errors with key and missing languages.
-    """
-    errors: list[dict[str, Any]] = []
-
-    for key in strings:
-        missing_langs = []
-        for lang, trans in translations.items():
-            if key not in trans:
-                missing_langs.append(lang)
-
-        if missing_langs:
-            errors.append(
+        # Most files never mention translation_key, so skip the regex
+        if b"translation_key" not in raw:
+            continue
+        file_name = str(py_file)
+
+        # Scan the whole file at once, counting newlines between matches
+        line_num = 1
+        offset = 0
+        for match in TRANSLATION_KEY_PATTERN.finditer(raw):
+            line_num += raw.count(b"\n", offset, match.start())
+            offset = match.start()
+            key = match.group(1).decode("utf-8")
+            if key not in used_keys:
+                used_keys[key] = []
+            used_keys[key].append(
                 {
-                    "key": key,
-                    "missing_langs": missing_langs,
+                    "file": file_name,
+                    "line": line_num,
                 }
             )
 
-    return errors
+    return used_keys
 
 
-def check_extra_keys(
+def check_translation_keys(
     strings: dict[str, str],
     translations: dict[str, dict[str, str]],
-) -> list[dict[str, Any]]:
-    """Check for keys in translations that don't exist in strings.json.
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Check for keys missing in, or extra in, translation files.
+
+    Computes both differences between strings.json and each language in a
+    single pass over the translation files.
 
-    Returns a list of warnings with key and languages where it appears.
+    Returns a tuple of errors with key and missing languages, and warnings
+    with key and languages where an extra key appears.
     """
-    warnings: list[dict[str, Any]] = []
-    extra_keys: dict[str, list[str]] = {}
+    missing_by_key: dict[str, list[str]] = {}
+    extra_by_key: dict[str, list[str]] = {}
+    string_keys = strings.keys()
 
     for lang, trans in translations.items():
-        for key in trans:
-            if key not in strings:
-                if key not in extra_keys:
-                    extra_keys[key] = []
-                extra_keys[key].append(lang)
-
-    for key, langs in extra_keys.items():
-        warnings.append(
-            {
-                "key": key,
-                "languages": langs,
-            }
-        )
-
-    return warnings
+        trans_keys = trans.keys()
+        for key in string_keys - trans_keys:
+            missing_by_key.setdefault(key, []).append(lang)
+        if extra := trans_keys - string_keys:
+            # Report extra keys in the order they appear in the file
+            for key in trans:
+                if key in extra:
+                    extra_by_key.setdefault(key, []).append(lang)
+
+    missing = [
+        {
+            "key": key,
+            "missing_langs": missing_by_key[key],
+        }
+        for key in strings
+        if key in missing_by_key
+    ]
+    extra_keys = [
+        {
+            "key": key,
+            "languages": langs,
+        }
+        for key, langs in extra_by_key.items()
+    ]
+
+    return missing, extra_keys
 
 
 def check_missing_keys_in_code(
@@ -201,13 +240,13 @@ def check_missing_keys_in_code(
 
     # Build set of keys from strings.json
     # translation_key can reference exceptions or issues
-    defined_keys = set()
-    for key in strings:
-        # Extract the key part (e.g., "exceptions.timeout.message" -> "timeout")
-        # or "issues.auth_error_invalid_token.title" -> "auth_error_invalid_token"
-        parts = key.split(".")
-        if len(parts) >= 2:
-            defined_keys.add(parts[1])
+    # Extract the key part (e.g., "exceptions.timeout.message" -> "timeout")
+    # or "issues.auth_error_invalid_token.title" -> "auth_error_invalid_token"
+    defined_keys = {
+        rest.partition(".")[0]
+        for _, separator, rest in (key.partition(".") for key in strings)
+        if separator
+    }
 
     for key, locations in used_keys.items():
         if key not in defined_keys:
@@ -234,7 +273,7 @@ def check_placeholder_consistency(
     for key, base_value in strings.items():
         base_placeholders = extract_placeholders(base_value)
 
-        inconsistencies: dict[str, set[str]] = {}
+        inconsistencies: dict[str, frozenset[str]] = {}
 
         for lang, trans in translations.items():
             if key in trans:
@@ -262,35 +301,26 @@ def check_empty_values(
 
     Returns a list of warnings with key and languages with empty values.
     """
-    warnings: list[dict[str, Any]] = []
+    empty_by_key: dict[str, list[str]] = {}
 
     # Check strings.json
     for key, value in strings.items():
-        if not value.strip():
-            warnings.append(
-                {
-                    "key": key,
-                    "languages": ["strings.json"],
-                }
-            )
+        if not value or value.isspace():
+            empty_by_key[key] = ["strings.json"]
 
     # Check translation files
     for lang, trans in translations.items():
         for key, value in trans.items():
-            if not value.strip():
-                # Check if already reported
-                existing = next((w for w in warnings if w["key"] == key), None)
-                if existing:
-                    existing["languages"].append(lang)
-                else:
-                    warnings.append(
-                        {
-                            "key": key,
-                            "languages": [lang],
-                        }
-                    )
-
-    return warnings
+            if not value or value.isspace():
+                empty_by_key.setdefault(key, []).append(lang)
+
+    return [
+        {
+            "key": key,
+            "languages": langs,
+        }
+        for key, langs in empty_by_key.items()
+    ]
 
 
 def main() -> int:
@@ -335,46 +365,62 @@ def main() -> int:
 
     has_errors = False
     has_warnings = False
+    # Detail lines of each failing check, written to stdout in one go
+    report: list[str]
+
+    if translations:
+        missing_translations, extra_keys = check_translation_keys(strings, translations)
+        placeholder_errors = check_placeholder_consistency(strings, translations)
+    else:
+        has_warnings = True
+        log_warn("No translation files found; skipping cross-language checks")
+        missing_translations, extra_keys, placeholder_errors = [], [], []
 
     # Check 1: Missing translations
     log_header("📋 Check 1: Missing translations across languages")
-    missing_translations = check_missing_translations(strings, translations)
 
-    if not missing_translations:
+    if not translations:
+        log_info("Skipped: no translation files found")
+    elif not missing_translations:
         log_success("All keys are translated in all languages!")
     else:
         has_errors = True
+        report = []
         log_error(
             f"Found {len(missing_translations)} keys with missing translations:\n"
         )
 
         for error in missing_translations[:20]:
-            print(f"  {COLORS['red']}{error['key']}{COLORS['reset']}")
-            print(
+            report.append(f"  {COLORS['red']}{error['key']}{COLORS['reset']}")
+            report.append(
                 f"    Missing in: {COLORS['yellow']}{', '.join(error['missing_langs'])}{COLORS['reset']}\n"
             )
 
         if len(missing_translations) > 20:
-            print(f"  ... and {len(missing_translations) - 20} more")
+            report.append(f"  ... and {len(missing_translations) - 20} more")
+        write_lines(report)
 
     # Check 2: Extra keys in translations
     log_header("📋 Check 2: Extra keys in translation files")
-    extra_keys = check_extra_keys(strings, translations)
 
-    if not extra_keys:
+    if not translations:
+        log_info("Skipped: no translation files found")
+    elif not extra_keys:
         log_success("No extra keys found in translation files!")
     else:
         has_warnings = True
+        report = []
         log_warn(f"Found {len(extra_keys)} extra keys in translation files:\n")
 
         for warning in extra_keys[:20]:
-            print(f"  {COLORS['yellow']}{warning['key']}{COLORS['reset']}")
-            print(
+            report.append(f"  {COLORS['yellow']}{warning['key']}{COLORS['reset']}")
+            report.append(
                 f"    Found in: {COLORS['cyan']}{', '.join(warning['languages'])}{COLORS['reset']}\n"
             )
 
         if len(extra_keys) > 20:
-            print(f"  ... and {len(extra_keys) - 20} more")
+            report.append(f"  ... and {len(extra_keys) - 20} more")
+        write_lines(report)
 
     # Check 3: Missing translation_keys in strings.json
     log_header("📋 Check 3: Translation keys used in code but not defined")
@@ -384,42 +430,49 @@ def main() -> int:
         log_success("All translation_keys used in code are defined in strings.json!")
     else:
         has_errors = True
+        report = []
         log_error(f"Found {len(missing_in_strings)} translation_keys not defined:\n")
 
         for error in missing_in_strings:
-            print(f"  {COLORS['red']}{error['key']}{COLORS['reset']}")
+            report.append(f"  {COLORS['red']}{error['key']}{COLORS['reset']}")
             for loc in error["locations"][:3]:
-                print(
+                report.append(
                     f"    {COLORS['cyan']}{loc['file']}:{loc['line']}{COLORS['reset']}"
                 )
             if len(error["locations"]) > 3:
-                print(f"    ... and {len(error['locations']) - 3} more locations")
-            print()
+                report.append(
+                    f"    ... and {len(error['locations']) - 3} more locations"
+                )
+            report.append("")
+        write_lines(report)
 
     # Check 4: Placeholder consistency
     log_header("📋 Check 4: Placeholder consistency across languages")
-    placeholder_errors = check_placeholder_consistency(strings, translations)
 
-    if not placeholder_errors:
+    if not translations:
+        log_info("Skipped: no translation files found")
+    elif not placeholder_errors:
         log_success("All languages have consistent placeholders!")
     else:
         has_errors = True
+        report = []
         log_error(
             f"Found {len(placeholder_errors)} keys with inconsistent placeholders:\n"
         )
 
         for error in placeholder_errors:
-            print(f"  {COLORS['red']}{error['key']}{COLORS['reset']}")
+            report.append(f"  {COLORS['red']}{error['key']}{COLORS['reset']}")
             base_ph = error["base_placeholders"]
-            print(
+            report.append(
                 f"    strings.json: {COLORS['green']}{{{', '.join(sorted(base_ph)) or 'none'}}}{COLORS['reset']}"
             )
 
             for lang, ph in error["inconsistencies"].items():
-                print(
+                report.append(
                     f"    {lang}: {COLORS['yellow']}{{{', '.join(sorted(ph)) or 'none'}}}{COLORS['reset']}"
                 )
-            print()
+            report.append("")
+        write_lines(report)
 
     # Check 5: Empty values
     log_header("📋 Check 5: Empty translation values")
@@ -429,16 +482,18 @@ def main() -> int:
         log_success("No empty translation values found!")
     else:
         has_warnings = True
+        report = []
         log_warn(f"Found {len(empty_values)} keys with empty values:\n")
 
         for warning in empty_values[:20]:
-            print(f"  {COLORS['yellow']}{warning['key']}{COLORS['reset']}")
-            print(
+            report.append(f"  {COLORS['yellow']}{warning['key']}{COLORS['reset']}")
+            report.append(
                 f"    Empty in: {COLORS['cyan']}{', '.join(warning['languages'])}{COLORS['reset']}\n"
             )
 
         if len(empty_values) > 20:
-            print(f"  ... and {len(empty_values) - 20} more")
+            report.append(f"  ... and {len(empty_values) - 20} more")
+        write_lines(report)
 
     # Summary
     log_header("📊 Summary")
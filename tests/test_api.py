@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
+import gc
+import json
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from energy_tracker_api import (
@@ -16,10 +20,30 @@ from energy_tracker_api import (
     TimeoutError,
     ValidationError,
 )
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import json_dumps
 import pytest
 
-from custom_components.energy_tracker.api import EnergyTrackerApi
+from custom_components.energy_tracker.api import (
+    _DEFAULT_ERROR_TRANSLATION,
+    _ERROR_TRANSLATIONS,
+    DATA_CONNECTOR,
+    EnergyTrackerApi,
+    _AdaptiveLimiter,
+    _RateLimitTracker,
+    async_close_connector,
+)
+
+# Timestamp of the meter readings sent in these tests
+TIMESTAMP = datetime(2025, 11, 28, 10, 30, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def mock_get_session():
+    """Prevent tests with a mocked SDK client from opening real HTTP sessions."""
+    with patch.object(EnergyTrackerApi, "_async_get_session"):
+        yield
 
 
 class TestEnergyTrackerApiInit:
@@ -35,6 +59,18 @@ class TestEnergyTrackerApiInit:
         assert api._hass == hass
         assert api._token == api_token
 
+    def test_init_precomputes_headers(self, hass, api_token):
+        """Test that __init__ builds the default request headers once."""
+        # Arrange & Act
+        with patch("custom_components.energy_tracker.api.EnergyTrackerClient"):
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+        # Assert
+        assert api._headers == {
+            "Authorization": f"Bearer {api_token}",
+            "Accept": "application/json",
+        }
+
     def test_init_creates_client(self, hass, api_token):
         """Test that __init__ creates EnergyTrackerClient."""
         # Arrange & Act
@@ -48,14 +84,368 @@ class TestEnergyTrackerApiInit:
             assert api._client == mock_client.return_value
 
 
+class TestEnergyTrackerApiSession:
+    """Test the dedicated HTTP session of EnergyTrackerApi."""
+
+    async def test_get_session_is_cached_and_shared_with_client(self, hass, api_token):
+        """Test that the session is created once and handed to the SDK client."""
+        # Arrange
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+            # Act
+            session = api._async_get_session()
+            second = api._async_get_session()
+
+            # Assert
+            assert session is second
+            assert mock_client_class.return_value._session is session
+            assert session.headers["Authorization"] == f"Bearer {api_token}"
+            assert session.json_serialize is json_dumps
+            assert session.timeout.total == 10
+            assert session.timeout.connect == 5
+
+            await api.async_close()
+
+    async def test_sdk_client_sends_requests_on_session(self, hass, api_token):
+        """Test that the SDK client sends its requests on the dedicated session."""
+        # Arrange
+        api = EnergyTrackerApi(hass=hass, token=api_token)
+        session = api._async_get_session()
+        response = MagicMock()
+        response.status = 200
+        response.json = AsyncMock(return_value={})
+        request_context = MagicMock()
+        request_context.__aenter__ = AsyncMock(return_value=response)
+        request_context.__aexit__ = AsyncMock(return_value=False)
+
+        # Act
+        with patch.object(
+            session, "request", return_value=request_context
+        ) as mock_request:
+            result = await api._client._make_request(
+                method="GET", endpoint="/v1/devices/standard"
+            )
+
+        # Assert
+        assert result is response
+        mock_request.assert_called_once()
+        assert await api._client._get_session() is session
+
+        await api.async_close()
+
+    async def test_async_close_closes_session(self, hass, api_token):
+        """Test that async_close closes the session and allows recreation."""
+        # Arrange
+        with patch("custom_components.energy_tracker.api.EnergyTrackerClient"):
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+            session = api._async_get_session()
+
+            # Act
+            await api.async_close()
+
+            # Assert
+            assert session.closed
+            assert api._session is None
+            new_session = api._async_get_session()
+            assert new_session is not session
+
+            await api.async_close()
+
+    async def test_sessions_share_connector(self, hass, api_token):
+        """Test that all API instances draw connections from one shared pool."""
+        # Arrange
+        with patch("custom_components.energy_tracker.api.EnergyTrackerClient"):
+            first = EnergyTrackerApi(hass=hass, token=api_token)
+            second = EnergyTrackerApi(hass=hass, token="other-token")
+
+            # Act
+            first_session = first._async_get_session()
+            second_session = second._async_get_session()
+            connector = first_session.connector
+            await first.async_close()
+
+            # Assert
+            assert connector is second_session.connector
+            assert connector is hass.data[DATA_CONNECTOR]
+            assert not connector.closed
+
+            await second.async_close()
+            await async_close_connector(hass)
+            assert connector.closed
+
+    async def test_recreated_connector_does_not_add_close_listeners(
+        self, hass, api_token
+    ):
+        """Test that recreating the pool leaves a single shutdown listener."""
+        # Arrange
+        listeners = hass.bus.async_listeners().get(EVENT_HOMEASSISTANT_CLOSE, 0)
+
+        with patch("custom_components.energy_tracker.api.EnergyTrackerClient"):
+            # Act
+            for _ in range(3):
+                api = EnergyTrackerApi(hass=hass, token=api_token)
+                api._async_get_session()
+                await api.async_close()
+                await async_close_connector(hass)
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+            api._async_get_session()
+
+            # Assert
+            assert (
+                hass.bus.async_listeners()[EVENT_HOMEASSISTANT_CLOSE] == listeners + 1
+            )
+
+            await api.async_close()
+            await async_close_connector(hass)
+            assert (
+                hass.bus.async_listeners().get(EVENT_HOMEASSISTANT_CLOSE, 0)
+                == listeners
+            )
+
+    async def test_async_close_without_session(self, hass, api_token):
+        """Test that async_close is a no-op before any request was made."""
+        # Arrange
+        with patch("custom_components.energy_tracker.api.EnergyTrackerClient"):
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+        # Act & Assert
+        await api.async_close()
+        assert api._session is None
+
+
+def _limiter(initial_limit: int = 10, max_limit: int = 50) -> _AdaptiveLimiter:
+    """Create an adaptive limiter with the integration's default tuning."""
+    return _AdaptiveLimiter(
+        min_limit=2,
+        max_limit=max_limit,
+        initial_limit=initial_limit,
+        increase=0.5,
+        decrease_factor=0.5,
+        target_latency=1.0,
+        window=20,
+    )
+
+
+class TestAdaptiveLimiter:
+    """Test the AIMD concurrency limiter."""
+
+    async def test_fast_requests_increase_limit(self):
+        """Test that requests within the latency target grow the limit additively."""
+        # Arrange
+        limiter = _limiter()
+
+        # Act
+        for _ in range(4):
+            async with limiter.slot():
+                pass
+
+        # Assert
+        assert limiter.limit == 12
+
+    async def test_server_error_halves_limit(self):
+        """Test that a server error shrinks the limit multiplicatively."""
+        # Arrange
+        limiter = _limiter()
+
+        # Act
+        with pytest.raises(EnergyTrackerAPIError):
+            async with limiter.slot():
+                raise EnergyTrackerAPIError("Server error: 503")
+
+        # Assert
+        assert limiter.limit == 5
+
+    async def test_slow_requests_decrease_limit_to_minimum(self):
+        """Test that latency overruns shrink the limit but not below the minimum."""
+        # Arrange
+        limiter = _limiter()
+
+        # Act
+        with patch(
+            "custom_components.energy_tracker.api.time.monotonic",
+            # Start, end and decrease time of four sequential requests
+            side_effect=[0.0, 5.0, 5.0, 10.0, 15.0, 15.0] * 2,
+        ):
+            for _ in range(4):
+                async with limiter.slot():
+                    pass
+
+        # Assert
+        assert limiter.limit == 2
+
+    async def test_concurrent_slow_requests_decrease_limit_once(self):
+        """Test that slow requests finishing together halve the limit only once."""
+        # Arrange
+        limiter = _limiter()
+        now = 0.0
+        release = asyncio.Event()
+
+        async def slow_request() -> None:
+            async with limiter.slot():
+                await release.wait()
+
+        # Act
+        with patch(
+            "custom_components.energy_tracker.api.time.monotonic",
+            side_effect=lambda: now,
+        ):
+            tasks = [asyncio.create_task(slow_request()) for _ in range(5)]
+            await asyncio.sleep(0)
+            now = 5.0
+            release.set()
+            await asyncio.gather(*tasks)
+
+        # Assert
+        assert limiter.limit == 5
+
+    async def test_client_error_does_not_decrease_limit(self):
+        """Test that client errors are not treated as backend overload."""
+        # Arrange
+        limiter = _limiter()
+
+        # Act
+        with pytest.raises(ValidationError):
+            async with limiter.slot():
+                raise ValidationError("Bad Request")
+
+        # Assert
+        assert limiter.limit == 10
+
+
+class TestRateLimitTracker:
+    """Test client-side pacing from rate limit headers."""
+
+    async def test_low_remaining_budget_pauses_until_reset(self):
+        """Test that a nearly exhausted budget pauses requests until reset."""
+        # Arrange
+        tracker = _RateLimitTracker(low_watermark=0.1, window=60)
+
+        with (
+            patch(
+                "custom_components.energy_tracker.api.time.monotonic",
+                return_value=100.0,
+            ),
+            patch(
+                "custom_components.energy_tracker.api.asyncio.sleep",
+                new_callable=AsyncMock,
+            ) as mock_sleep,
+        ):
+            tracker.update(
+                {
+                    "X-RateLimit-Limit": "100",
+                    "X-RateLimit-Remaining": "5",
+                    "X-RateLimit-Reset": "30",
+                }
+            )
+
+            # Act
+            await tracker.wait()
+
+        # Assert
+        mock_sleep.assert_awaited_once_with(30.0)
+
+    async def test_healthy_budget_does_not_pause(self):
+        """Test that requests are not delayed while enough budget remains."""
+        # Arrange
+        tracker = _RateLimitTracker(low_watermark=0.1, window=60)
+        tracker.update(
+            {
+                "X-RateLimit-Limit": "100",
+                "X-RateLimit-Remaining": "50",
+                "X-RateLimit-Reset": "30",
+            }
+        )
+
+        # Act
+        with patch(
+            "custom_components.energy_tracker.api.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            await tracker.wait()
+
+        # Assert
+        mock_sleep.assert_not_awaited()
+
+    async def test_sliding_window_caps_requests_at_advertised_limit(self):
+        """Test that the local window waits once the advertised limit is used."""
+        # Arrange
+        tracker = _RateLimitTracker(low_watermark=0.1, window=60)
+        tracker.update({"X-RateLimit-Limit": "2", "X-RateLimit-Remaining": "2"})
+
+        with (
+            patch(
+                "custom_components.energy_tracker.api.time.monotonic",
+                side_effect=[0.0, 1.0, 2.0, 60.0],
+            ),
+            patch(
+                "custom_components.energy_tracker.api.asyncio.sleep",
+                new_callable=AsyncMock,
+            ) as mock_sleep,
+        ):
+            # Act
+            for _ in range(3):
+                await tracker.wait()
+
+        # Assert
+        mock_sleep.assert_awaited_once_with(58.0)
+
+    async def test_session_tracks_response_headers(self, hass, api_token):
+        """Test that responses on the session update the rate limit state."""
+        # Arrange
+        with patch("custom_components.energy_tracker.api.EnergyTrackerClient"):
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+            session = api._async_get_session()
+            params = MagicMock()
+            params.response.headers = {
+                "X-RateLimit-Limit": "100",
+                "X-RateLimit-Remaining": "99",
+            }
+
+            # Act
+            for trace_config in session.trace_configs:
+                await trace_config.on_request_end[0](session, None, params)
+
+            # Assert
+            assert api._rate_limit._limit == 100
+
+            await api.async_close()
+
+
+class TestErrorTranslations:
+    """Test the translation of API errors."""
+
+    def test_translation_keys_exist_in_strings(self):
+        """Test that every error translation key is defined in strings.json."""
+        # Arrange
+        strings_path = (
+            Path(__file__).parents[1] / "custom_components/energy_tracker/strings.json"
+        )
+        exceptions = json.loads(strings_path.read_text(encoding="utf-8"))["exceptions"]
+        translation_keys = {
+            entry.translation_key
+            for entry in (*_ERROR_TRANSLATIONS.values(), _DEFAULT_ERROR_TRANSLATION)
+        }
+
+        # Act
+        missing = translation_keys - exceptions.keys()
+
+        # Assert
+        assert not missing
+        assert "rate_limit_no_time" in exceptions
+
+
+@pytest.mark.usefixtures("mock_get_session")
 class TestSendMeterReading:
     """Test send_meter_reading method."""
 
-    @pytest.mark.asyncio
     async def test_send_meter_reading_success(self, hass, api_token, device_id):
         """Test successful meter reading submission."""
         # Arrange
-        timestamp = datetime(2025, 11, 28, 10, 30, 0, tzinfo=UTC)
+        timestamp = TIMESTAMP
 
         with patch(
             "custom_components.energy_tracker.api.EnergyTrackerClient"
@@ -83,13 +473,12 @@ class TestSendMeterReading:
             assert call_args[1]["meter_reading"].timestamp == timestamp
             assert call_args[1]["allow_rounding"] is True
 
-    @pytest.mark.asyncio
     async def test_send_meter_reading_without_rounding(
         self, hass, api_token, device_id
     ):
         """Test meter reading submission without rounding."""
         # Arrange
-        timestamp = datetime(2025, 11, 28, 10, 30, 0, tzinfo=UTC)
+        timestamp = TIMESTAMP
 
         with patch(
             "custom_components.energy_tracker.api.EnergyTrackerClient"
@@ -113,13 +502,208 @@ class TestSendMeterReading:
             call_args = mock_client.meter_readings.create.call_args
             assert call_args[1]["allow_rounding"] is False
 
-    @pytest.mark.asyncio
+    async def test_send_meter_reading_coalesces_identical_readings(
+        self, hass, api_token, device_id
+    ):
+        """Test that identical concurrent readings share a single request."""
+        # Arrange
+        timestamp = TIMESTAMP
+        release = asyncio.Event()
+
+        async def _slow_create(**kwargs):
+            await release.wait()
+
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.meter_readings.create = AsyncMock(side_effect=_slow_create)
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+            kwargs = {
+                "source_entity_id": "sensor.power_meter",
+                "device_id": device_id,
+                "value": 1234.5,
+                "timestamp": timestamp,
+                "allow_rounding": True,
+            }
+
+            # Act
+            first = asyncio.ensure_future(api.send_meter_reading(**kwargs))
+            second = asyncio.ensure_future(api.send_meter_reading(**kwargs))
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(first, second)
+
+            # Assert
+            mock_client.meter_readings.create.assert_called_once()
+
+    async def test_send_meter_reading_coalesced_error_raised_for_all(
+        self, hass, api_token, device_id
+    ):
+        """Test that a failing coalesced request raises for every caller."""
+        # Arrange
+        timestamp = TIMESTAMP
+        release = asyncio.Event()
+
+        async def _failing_create(**kwargs):
+            await release.wait()
+            raise NetworkError("Connection refused")
+
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.meter_readings.create = AsyncMock(side_effect=_failing_create)
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+            kwargs = {
+                "source_entity_id": "sensor.power_meter",
+                "device_id": device_id,
+                "value": 1234.5,
+                "timestamp": timestamp,
+            }
+
+            # Act
+            first = asyncio.ensure_future(api.send_meter_reading(**kwargs))
+            second = asyncio.ensure_future(api.send_meter_reading(**kwargs))
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(first, second, return_exceptions=True)
+
+            # Assert
+            mock_client.meter_readings.create.assert_called_once()
+            assert all(isinstance(result, HomeAssistantError) for result in results)
+            assert all(result.translation_key == "network_error" for result in results)
+
+    async def test_send_meter_reading_error_retrieved_when_callers_cancelled(
+        self, hass, api_token, device_id, caplog
+    ):
+        """Test that a failing request is not reported unhandled after cancellation."""
+        # Arrange
+        release = asyncio.Event()
+
+        async def _failing_create(**kwargs):
+            await release.wait()
+            raise NetworkError("Connection refused")
+
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.meter_readings.create = AsyncMock(side_effect=_failing_create)
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+            caller = asyncio.ensure_future(
+                api.send_meter_reading(
+                    source_entity_id="sensor.power_meter",
+                    device_id=device_id,
+                    value=1234.5,
+                    timestamp=TIMESTAMP,
+                )
+            )
+            await asyncio.sleep(0)
+            (task,) = api._pending_readings.values()
+
+            # Act
+            caller.cancel()
+            release.set()
+            await asyncio.wait([caller, task])
+            del task
+            gc.collect()
+
+            # Assert
+            assert caller.cancelled()
+            assert not api._pending_readings
+            assert "Task exception was never retrieved" not in caplog.text
+
+    async def test_send_meter_reading_different_values_not_coalesced(
+        self, hass, api_token, device_id
+    ):
+        """Test that readings with different values are sent separately."""
+        # Arrange
+        timestamp = TIMESTAMP
+
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.meter_readings.create = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+            # Act
+            await asyncio.gather(
+                api.send_meter_reading(
+                    source_entity_id="sensor.power_meter",
+                    device_id=device_id,
+                    value=1234.5,
+                    timestamp=timestamp,
+                ),
+                api.send_meter_reading(
+                    source_entity_id="sensor.power_meter",
+                    device_id=device_id,
+                    value=1234.6,
+                    timestamp=timestamp,
+                ),
+            )
+
+            # Assert
+            assert mock_client.meter_readings.create.call_count == 2
+
+    async def test_send_meter_reading_limits_concurrent_requests(
+        self, hass, api_token, device_id
+    ):
+        """Test that concurrent readings never exceed the request slot limit."""
+        # Arrange
+        timestamp = TIMESTAMP
+        in_flight = 0
+        max_in_flight = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.meter_readings.create = AsyncMock(side_effect=create)
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+            api._limiter = _limiter(initial_limit=2, max_limit=2)
+
+            # Act
+            await asyncio.gather(
+                *(
+                    api.send_meter_reading(
+                        source_entity_id="sensor.power_meter",
+                        device_id=device_id,
+                        value=float(value),
+                        timestamp=timestamp,
+                    )
+                    for value in range(5)
+                )
+            )
+
+            # Assert
+            assert mock_client.meter_readings.create.call_count == 5
+            assert max_in_flight == 2
+
     async def test_send_meter_reading_validation_error(
         self, hass, api_token, device_id
     ):
         """Test meter reading with validation error (HTTP 400)."""
         # Arrange
-        timestamp = datetime(2025, 11, 28, 10, 30, 0, tzinfo=UTC)
+        timestamp = TIMESTAMP
 
         with patch(
             "custom_components.energy_tracker.api.EnergyTrackerClient"
@@ -148,13 +732,12 @@ class TestSendMeterReading:
                 == "Invalid timestamp; Value required"
             )
 
-    @pytest.mark.asyncio
     async def test_send_meter_reading_authentication_error(
         self, hass, api_token, device_id
     ):
         """Test meter reading with authentication error (HTTP 401)."""
         # Arrange
-        timestamp = datetime(2025, 11, 28, 10, 30, 0, tzinfo=UTC)
+        timestamp = TIMESTAMP
 
         with patch(
             "custom_components.energy_tracker.api.EnergyTrackerClient"
@@ -177,11 +760,10 @@ class TestSendMeterReading:
 
             assert exc_info.value.translation_key == "auth_failed"
 
-    @pytest.mark.asyncio
     async def test_send_meter_reading_forbidden_error(self, hass, api_token, device_id):
         """Test meter reading with forbidden error (HTTP 403)."""
         # Arrange
-        timestamp = datetime(2025, 11, 28, 10, 30, 0, tzinfo=UTC)
+        timestamp = TIMESTAMP
 
         with patch(
             "custom_components.energy_tracker.api.EnergyTrackerClient"
@@ -204,11 +786,10 @@ class TestSendMeterReading:
 
             assert exc_info.value.translation_key == "auth_failed"
 
-    @pytest.mark.asyncio
     async def test_send_meter_reading_not_found_error(self, hass, api_token, device_id):
         """Test meter reading with not found error (HTTP 404)."""
         # Arrange
-        timestamp = datetime(2025, 11, 28, 10, 30, 0, tzinfo=UTC)
+        timestamp = TIMESTAMP
 
         with patch(
             "custom_components.energy_tracker.api.EnergyTrackerClient"
@@ -231,11 +812,10 @@ class TestSendMeterReading:
 
             assert exc_info.value.translation_key == "device_not_found"
 
-    @pytest.mark.asyncio
     async def test_send_meter_reading_conflict_error(self, hass, api_token, device_id):
         """Test meter reading with conflict error (HTTP 409)."""
         # Arrange
-        timestamp = datetime(2025, 11, 28, 10, 30, 0, tzinfo=UTC)
+        timestamp = TIMESTAMP
 
         with patch(
             "custom_components.energy_tracker.api.EnergyTrackerClient"
@@ -263,13 +843,12 @@ class TestSendMeterReading:
                 in exc_info.value.translation_placeholders["error"]
             )
 
-    @pytest.mark.asyncio
     async def test_send_meter_reading_rate_limit_with_retry(
         self, hass, api_token, device_id
     ):
         """Test meter reading with rate limit error including retry_after."""
         # Arrange
-        timestamp = datetime(2025, 11, 28, 10, 30, 0, tzinfo=UTC)
+        timestamp = TIMESTAMP
 
         with patch(
             "custom_components.energy_tracker.api.EnergyTrackerClient"
@@ -293,13 +872,12 @@ class TestSendMeterReading:
             assert exc_info.value.translation_key == "rate_limit"
             assert exc_info.value.translation_placeholders["retry_after"] == "60"
 
-    @pytest.mark.asyncio
     async def test_send_meter_reading_rate_limit_without_retry(
         self, hass, api_token, device_id
     ):
         """Test meter reading with rate limit error without retry_after."""
         # Arrange
-        timestamp = datetime(2025, 11, 28, 10, 30, 0, tzinfo=UTC)
+        timestamp = TIMESTAMP
 
         with patch(
             "custom_components.energy_tracker.api.EnergyTrackerClient"
@@ -322,11 +900,10 @@ class TestSendMeterReading:
 
             assert exc_info.value.translation_key == "rate_limit_no_time"
 
-    @pytest.mark.asyncio
     async def test_send_meter_reading_timeout_error(self, hass, api_token, device_id):
         """Test meter reading with timeout error."""
         # Arrange
-        timestamp = datetime(2025, 11, 28, 10, 30, 0, tzinfo=UTC)
+        timestamp = TIMESTAMP
 
         with patch(
             "custom_components.energy_tracker.api.EnergyTrackerClient"
@@ -349,11 +926,10 @@ class TestSendMeterReading:
 
             assert exc_info.value.translation_key == "timeout"
 
-    @pytest.mark.asyncio
     async def test_send_meter_reading_network_error(self, hass, api_token, device_id):
         """Test meter reading with network error."""
         # Arrange
-        timestamp = datetime(2025, 11, 28, 10, 30, 0, tzinfo=UTC)
+        timestamp = TIMESTAMP
 
         with patch(
             "custom_components.energy_tracker.api.EnergyTrackerClient"
@@ -376,11 +952,10 @@ class TestSendMeterReading:
 
             assert exc_info.value.translation_key == "network_error"
 
-    @pytest.mark.asyncio
     async def test_send_meter_reading_server_error(self, hass, api_token, device_id):
         """Test meter reading with server error (5xx)."""
         # Arrange
-        timestamp = datetime(2025, 11, 28, 10, 30, 0, tzinfo=UTC)
+        timestamp = TIMESTAMP
 
         with patch(
             "custom_components.energy_tracker.api.EnergyTrackerClient"
@@ -395,7 +970,13 @@ class TestSendMeterReading:
             api = EnergyTrackerApi(hass=hass, token=api_token)
 
             # Act & Assert
-            with pytest.raises(HomeAssistantError) as exc_info:
+            with (
+                patch(
+                    "custom_components.energy_tracker.api.asyncio.sleep",
+                    new_callable=AsyncMock,
+                ),
+                pytest.raises(HomeAssistantError) as exc_info,
+            ):
                 await api.send_meter_reading(
                     source_entity_id="sensor.power_meter",
                     device_id=device_id,
@@ -403,32 +984,36 @@ class TestSendMeterReading:
                     timestamp=timestamp,
                 )
 
+            assert mock_client.meter_readings.create.call_count == 3
             assert exc_info.value.translation_key == "server_error"
             assert (
                 exc_info.value.translation_placeholders["error"]
                 == "Database unavailable"
             )
 
-    @pytest.mark.asyncio
-    async def test_send_meter_reading_unexpected_error(
+    async def test_send_meter_reading_retries_server_error(
         self, hass, api_token, device_id
     ):
-        """Test meter reading with unexpected error."""
+        """Test that a transient server error is retried with backoff."""
         # Arrange
-        timestamp = datetime(2025, 11, 28, 10, 30, 0, tzinfo=UTC)
+        timestamp = TIMESTAMP
 
         with patch(
             "custom_components.energy_tracker.api.EnergyTrackerClient"
         ) as mock_client_class:
             mock_client = MagicMock()
-            error = RuntimeError("Something went wrong")
-            mock_client.meter_readings.create = AsyncMock(side_effect=error)
+            mock_client.meter_readings.create = AsyncMock(
+                side_effect=[EnergyTrackerAPIError("Server error: 503"), None]
+            )
             mock_client_class.return_value = mock_client
 
             api = EnergyTrackerApi(hass=hass, token=api_token)
 
-            # Act & Assert
-            with pytest.raises(HomeAssistantError) as exc_info:
+            # Act
+            with patch(
+                "custom_components.energy_tracker.api.asyncio.sleep",
+                new_callable=AsyncMock,
+            ) as mock_sleep:
                 await api.send_meter_reading(
                     source_entity_id="sensor.power_meter",
                     device_id=device_id,
@@ -436,8 +1021,808 @@ class TestSendMeterReading:
                     timestamp=timestamp,
                 )
 
-            assert exc_info.value.translation_key == "unknown_error"
-            assert (
-                exc_info.value.translation_placeholders["error"]
-                == "Something went wrong"
+            # Assert
+            assert mock_client.meter_readings.create.call_count == 2
+            mock_sleep.assert_awaited_once()
+            assert 0 <= mock_sleep.call_args.args[0] <= 1.0
+
+    async def test_send_meter_reading_retries_short_rate_limit(
+        self, hass, api_token, device_id
+    ):
+        """Test that a rate limit with a short Retry-After is waited out once."""
+        # Arrange
+        timestamp = TIMESTAMP
+
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.meter_readings.create = AsyncMock(
+                side_effect=[RateLimitError("Too Many Requests", retry_after=2), None]
             )
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+            # Act
+            with patch(
+                "custom_components.energy_tracker.api.asyncio.sleep",
+                new_callable=AsyncMock,
+            ) as mock_sleep:
+                await api.send_meter_reading(
+                    source_entity_id="sensor.power_meter",
+                    device_id=device_id,
+                    value=1234.5,
+                    timestamp=timestamp,
+                )
+
+            # Assert
+            assert mock_client.meter_readings.create.call_count == 2
+            mock_sleep.assert_awaited_once_with(2.0)
+
+    async def test_send_meter_reading_conflict_after_retry_is_raised(
+        self, hass, api_token, device_id
+    ):
+        """Test that a conflict on a retry is not mistaken for our reading."""
+        # Arrange
+        timestamp = TIMESTAMP
+
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.meter_readings.create = AsyncMock(
+                side_effect=[
+                    EnergyTrackerAPIError("Server error: 502"),
+                    ConflictError("Conflict"),
+                ]
+            )
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+            # Act & Assert
+            with (
+                patch(
+                    "custom_components.energy_tracker.api.asyncio.sleep",
+                    new_callable=AsyncMock,
+                ),
+                pytest.raises(HomeAssistantError) as exc_info,
+            ):
+                await api.send_meter_reading(
+                    source_entity_id="sensor.power_meter",
+                    device_id=device_id,
+                    value=1234.5,
+                    timestamp=timestamp,
+                )
+
+            assert exc_info.value.translation_key == "conflict"
+            assert mock_client.meter_readings.create.call_count == 2
+
+    async def test_send_meter_reading_sets_idempotency_key(
+        self, hass, api_token, device_id
+    ):
+        """Test that each attempt of a reading carries the same idempotency key."""
+        # Arrange
+        timestamp = TIMESTAMP
+        sent_headers: list[dict[str, str]] = []
+
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+            async def create(**kwargs):
+                params = MagicMock(headers={})
+                await api._on_request_start(None, None, params)
+                sent_headers.append(params.headers)
+                if len(sent_headers) == 1:
+                    raise EnergyTrackerAPIError("Server error: 503")
+
+            mock_client.meter_readings.create = AsyncMock(side_effect=create)
+
+            # Act
+            with patch(
+                "custom_components.energy_tracker.api.asyncio.sleep",
+                new_callable=AsyncMock,
+            ):
+                await api.send_meter_reading(
+                    source_entity_id="sensor.power_meter",
+                    device_id=device_id,
+                    value=1234.5,
+                    timestamp=timestamp,
+                )
+
+            # Assert
+            keys = {headers["Idempotency-Key"] for headers in sent_headers}
+            assert len(sent_headers) == 2
+            assert len(keys) == 1
+
+            params = MagicMock(headers={})
+            await api._on_request_start(None, None, params)
+            assert "Idempotency-Key" not in params.headers
+
+    async def test_send_meter_reading_client_error_not_retried(
+        self, hass, api_token, device_id
+    ):
+        """Test that a non-5xx HTTP error is raised without retrying."""
+        # Arrange
+        timestamp = TIMESTAMP
+
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            error = EnergyTrackerAPIError("HTTP error: 422")
+            mock_client.meter_readings.create = AsyncMock(side_effect=error)
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+            # Act & Assert
+            with pytest.raises(HomeAssistantError):
+                await api.send_meter_reading(
+                    source_entity_id="sensor.power_meter",
+                    device_id=device_id,
+                    value=1234.5,
+                    timestamp=timestamp,
+                )
+
+            mock_client.meter_readings.create.assert_called_once()
+
+    async def test_send_meter_reading_circuit_opens_after_failures(
+        self, hass, api_token, device_id
+    ):
+        """Test that repeated network errors open the circuit breaker."""
+        # Arrange
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            error = NetworkError("Network unreachable")
+            mock_client.meter_readings.create = AsyncMock(side_effect=error)
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+            for minute in range(5):
+                with pytest.raises(HomeAssistantError):
+                    await api.send_meter_reading(
+                        source_entity_id="sensor.power_meter",
+                        device_id=device_id,
+                        value=1234.5,
+                        timestamp=datetime(2025, 11, 28, 10, minute, 0, tzinfo=UTC),
+                    )
+
+            # Act & Assert
+            with pytest.raises(HomeAssistantError) as exc_info:
+                await api.send_meter_reading(
+                    source_entity_id="sensor.power_meter",
+                    device_id=device_id,
+                    value=1234.5,
+                    timestamp=TIMESTAMP,
+                )
+
+            assert exc_info.value.translation_key == "circuit_open"
+            assert mock_client.meter_readings.create.call_count == 5
+
+    async def test_send_meter_reading_circuit_half_open_probe_closes(
+        self, hass, api_token, device_id
+    ):
+        """Test that a successful probe after the recovery time closes the circuit."""
+        # Arrange
+        timestamp = TIMESTAMP
+
+        with (
+            patch(
+                "custom_components.energy_tracker.api.EnergyTrackerClient"
+            ) as mock_client_class,
+            patch(
+                "custom_components.energy_tracker.api.time.monotonic",
+                return_value=100.0,
+            ) as mock_monotonic,
+        ):
+            mock_client = MagicMock()
+            mock_client.meter_readings.create = AsyncMock(return_value=None)
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+            for _ in range(5):
+                api._circuit.record_failure()
+            assert api._circuit.allow_request() == (False, False)
+
+            mock_monotonic.return_value = 130.0
+
+            # Act
+            await api.send_meter_reading(
+                source_entity_id="sensor.power_meter",
+                device_id=device_id,
+                value=1234.5,
+                timestamp=timestamp,
+            )
+
+            # Assert
+            mock_client.meter_readings.create.assert_called_once()
+            api._circuit.record_failure()
+            assert api._circuit.allow_request() == (True, False)
+
+    async def test_send_meter_reading_circuit_probe_client_error_closes(
+        self, hass, api_token, device_id
+    ):
+        """Test that a probe rejected with a client error closes the circuit."""
+        # Arrange
+        with (
+            patch(
+                "custom_components.energy_tracker.api.EnergyTrackerClient"
+            ) as mock_client_class,
+            patch(
+                "custom_components.energy_tracker.api.time.monotonic",
+                return_value=100.0,
+            ) as mock_monotonic,
+        ):
+            mock_client = MagicMock()
+            mock_client.meter_readings.create = AsyncMock(
+                side_effect=[ValidationError("Bad Request"), None, None]
+            )
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+            for _ in range(5):
+                api._circuit.record_failure()
+
+            mock_monotonic.return_value = 130.0
+
+            # Act
+            with pytest.raises(HomeAssistantError) as exc_info:
+                await api.send_meter_reading(
+                    source_entity_id="sensor.power_meter",
+                    device_id=device_id,
+                    value=1234.5,
+                    timestamp=TIMESTAMP,
+                )
+
+            # Assert
+            assert exc_info.value.translation_key == "bad_request"
+            for value in (1235.0, 1236.0):
+                await api.send_meter_reading(
+                    source_entity_id="sensor.power_meter",
+                    device_id=device_id,
+                    value=value,
+                    timestamp=TIMESTAMP,
+                )
+            assert mock_client.meter_readings.create.call_count == 3
+            assert api._circuit.allow_request() == (True, False)
+
+    async def test_send_meter_reading_circuit_half_open_allows_single_probe(
+        self, hass, api_token, device_id
+    ):
+        """Test that only one call reaches the backend while the circuit probes."""
+        # Arrange
+        probe_started = asyncio.Event()
+        finish_probe = asyncio.Event()
+
+        async def slow_create(**kwargs):
+            probe_started.set()
+            await finish_probe.wait()
+
+        with (
+            patch(
+                "custom_components.energy_tracker.api.EnergyTrackerClient"
+            ) as mock_client_class,
+            patch(
+                "custom_components.energy_tracker.api.time.monotonic",
+                return_value=100.0,
+            ) as mock_monotonic,
+        ):
+            mock_client = MagicMock()
+            mock_client.meter_readings.create = AsyncMock(side_effect=slow_create)
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+            for _ in range(5):
+                api._circuit.record_failure()
+
+            mock_monotonic.return_value = 130.0
+
+            # Act
+            probe = asyncio.create_task(
+                api.send_meter_reading(
+                    source_entity_id="sensor.power_meter",
+                    device_id=device_id,
+                    value=1234.5,
+                    timestamp=TIMESTAMP,
+                )
+            )
+            await probe_started.wait()
+
+            # Assert
+            for value in (1235.0, 1236.0):
+                with pytest.raises(HomeAssistantError) as exc_info:
+                    await api.send_meter_reading(
+                        source_entity_id="sensor.power_meter",
+                        device_id=device_id,
+                        value=value,
+                        timestamp=TIMESTAMP,
+                    )
+                assert exc_info.value.translation_key == "circuit_open"
+
+            finish_probe.set()
+            await probe
+            mock_client.meter_readings.create.assert_called_once()
+            assert api._circuit.allow_request() == (True, False)
+
+    async def test_send_meter_reading_circuit_earlier_request_keeps_probe(
+        self, hass, api_token, device_id
+    ):
+        """Test that a request started before the circuit opened keeps the probe."""
+        # Arrange
+        probe_started = asyncio.Event()
+        finish_earlier = asyncio.Event()
+        finish_probe = asyncio.Event()
+
+        async def slow_create(**kwargs):
+            if kwargs["meter_reading"].value == 1234.5:
+                await finish_earlier.wait()
+                raise ValidationError("Bad Request")
+            probe_started.set()
+            await finish_probe.wait()
+
+        with (
+            patch(
+                "custom_components.energy_tracker.api.EnergyTrackerClient"
+            ) as mock_client_class,
+            patch(
+                "custom_components.energy_tracker.api.time.monotonic",
+                return_value=100.0,
+            ) as mock_monotonic,
+        ):
+            mock_client = MagicMock()
+            mock_client.meter_readings.create = AsyncMock(side_effect=slow_create)
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+            kwargs = {
+                "source_entity_id": "sensor.power_meter",
+                "device_id": device_id,
+                "timestamp": TIMESTAMP,
+            }
+            earlier = asyncio.ensure_future(
+                api.send_meter_reading(value=1234.5, **kwargs)
+            )
+            await asyncio.sleep(0)
+            for _ in range(5):
+                api._circuit.record_failure()
+
+            mock_monotonic.return_value = 130.0
+            probe = asyncio.ensure_future(
+                api.send_meter_reading(value=1235.0, **kwargs)
+            )
+            await probe_started.wait()
+
+            # Act
+            finish_earlier.set()
+            with pytest.raises(HomeAssistantError):
+                await earlier
+
+            allowed_during_probe = api._circuit.allow_request()
+            finish_probe.set()
+            await probe
+
+            # Assert
+            assert allowed_during_probe == (False, False)
+            assert mock_client.meter_readings.create.call_count == 2
+
+    async def test_send_meter_reading_unexpected_error(
+        self, hass, api_token, device_id
+    ):
+        """Test meter reading with unexpected error."""
+        # Arrange
+        timestamp = TIMESTAMP
+
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            error = RuntimeError("Something went wrong")
+            mock_client.meter_readings.create = AsyncMock(side_effect=error)
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+            # Act & Assert
+            with pytest.raises(HomeAssistantError) as exc_info:
+                await api.send_meter_reading(
+                    source_entity_id="sensor.power_meter",
+                    device_id=device_id,
+                    value=1234.5,
+                    timestamp=timestamp,
+                )
+
+            assert exc_info.value.translation_key == "unknown_error"
+            assert (
+                exc_info.value.translation_placeholders["error"]
+                == "Something went wrong"
+            )
+
+
+def _devices_response(
+    headers: dict[str, str] | None = None,
+    last_updated_at: str = "2025-11-28T10:30:00Z",
+) -> MagicMock:
+    """Return a mocked response with a single device."""
+    response = MagicMock()
+    response.status = 200
+    response.headers = headers or {}
+    response.read = AsyncMock(
+        return_value=json_dumps(
+            [
+                {
+                    "id": "device-1",
+                    "name": "Electricity",
+                    "folderPath": "/Home",
+                    "lastUpdatedAt": last_updated_at,
+                }
+            ]
+        ).encode()
+    )
+    return response
+
+
+@pytest.mark.usefixtures("mock_get_session")
+class TestGetDevices:
+    """Test fetching devices."""
+
+    async def test_get_devices_sends_only_set_filters(self, hass, api_token):
+        """Test that unset filters are omitted from the query string."""
+        # Arrange
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            mock_client._make_request = AsyncMock(return_value=_devices_response())
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+            # Act
+            devices = await api.get_devices(folder_path="/Home")
+
+            # Assert
+            assert mock_client._make_request.call_args.kwargs["params"] == {
+                "folderPath": "/Home"
+            }
+            assert devices[0].id == "device-1"
+            assert devices[0].folder_path == "/Home"
+
+    async def test_get_devices_always_asks_the_api(self, hass, api_token):
+        """Test that a repeated request sees devices updated in the meantime."""
+        # Arrange
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            mock_client._make_request = AsyncMock(
+                side_effect=[
+                    _devices_response(),
+                    _devices_response(last_updated_at="2025-11-28T10:35:00Z"),
+                ]
+            )
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+            await api.get_devices()
+
+            # Act
+            devices = await api.get_devices()
+
+            # Assert
+            assert mock_client._make_request.call_count == 2
+            assert devices[0].last_updated_at == "2025-11-28T10:35:00Z"
+
+    async def test_get_devices_revalidates_cached_list(self, hass, api_token):
+        """Test that a cached device list is revalidated with its ETag."""
+        # Arrange
+        not_modified = MagicMock()
+        not_modified.status = 304
+        not_modified.read = AsyncMock(return_value=b"")
+
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            mock_client._make_request = AsyncMock(
+                side_effect=[
+                    _devices_response(
+                        {
+                            "ETag": '"v1"',
+                            "Last-Modified": "Fri, 28 Nov 2025 10:30:00 GMT",
+                        }
+                    ),
+                    not_modified,
+                ]
+            )
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+            first = await api.get_devices()
+
+            # Act
+            second = await api.get_devices()
+
+            # Assert
+            assert second == first
+            assert second is not first
+            assert mock_client._make_request.call_args_list[0].kwargs["headers"] is None
+            assert mock_client._make_request.call_args.kwargs["headers"] == {
+                "If-None-Match": '"v1"',
+                "If-Modified-Since": "Fri, 28 Nov 2025 10:30:00 GMT",
+            }
+            not_modified.read.assert_not_awaited()
+
+    async def test_send_meter_reading_clears_device_cache(
+        self, hass, api_token, device_id
+    ):
+        """Test that sending a reading invalidates cached device lists."""
+        # Arrange
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            mock_client._make_request = AsyncMock(
+                return_value=_devices_response({"ETag": '"v1"'})
+            )
+            mock_client.meter_readings.create = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+            await api.get_devices()
+
+            # Act
+            await api.send_meter_reading(
+                source_entity_id="sensor.power_meter",
+                device_id=device_id,
+                value=1234.5,
+                timestamp=TIMESTAMP,
+            )
+            await api.get_devices()
+
+            # Assert
+            assert mock_client._make_request.call_count == 2
+            assert mock_client._make_request.call_args.kwargs["headers"] is None
+
+    async def test_get_devices_retries_network_error(self, hass, api_token):
+        """Test that a transient network error is retried with backoff."""
+        # Arrange
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            mock_client._make_request = AsyncMock(
+                side_effect=[NetworkError("Server disconnected"), _devices_response()]
+            )
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+            # Act
+            with patch(
+                "custom_components.energy_tracker.api.asyncio.sleep",
+                new_callable=AsyncMock,
+            ) as mock_sleep:
+                devices = await api.get_devices()
+
+            # Assert
+            assert [device.id for device in devices] == ["device-1"]
+            mock_sleep.assert_awaited_once()
+            assert 0 <= mock_sleep.call_args.args[0] <= 1.0
+
+    async def test_get_devices_server_error_decreases_limit(self, hass, api_token):
+        """Test that device list requests feed back into the adaptive limiter."""
+        # Arrange
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            mock_client._make_request = AsyncMock(
+                side_effect=[
+                    EnergyTrackerAPIError("Server error: 503"),
+                    _devices_response(),
+                ]
+            )
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+            # Act
+            with patch(
+                "custom_components.energy_tracker.api.asyncio.sleep",
+                new_callable=AsyncMock,
+            ):
+                await api.get_devices()
+
+            # Assert
+            assert api._limiter.limit == 10
+
+    async def test_get_devices_pauses_when_budget_low(self, hass, api_token):
+        """Test that a device list request waits while the rate limit is low."""
+        # Arrange
+        with (
+            patch(
+                "custom_components.energy_tracker.api.EnergyTrackerClient"
+            ) as mock_client_class,
+            patch(
+                "custom_components.energy_tracker.api.time.monotonic",
+                return_value=100.0,
+            ),
+        ):
+            mock_client = MagicMock()
+            mock_client._make_request = AsyncMock(return_value=_devices_response())
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+            api._rate_limit.update(
+                {
+                    "X-RateLimit-Limit": "100",
+                    "X-RateLimit-Remaining": "5",
+                    "X-RateLimit-Reset": "30",
+                }
+            )
+
+            # Act
+            with patch(
+                "custom_components.energy_tracker.api.asyncio.sleep",
+                new_callable=AsyncMock,
+            ) as mock_sleep:
+                await api.get_devices()
+
+            # Assert
+            mock_sleep.assert_awaited_once_with(30.0)
+            mock_client._make_request.assert_awaited_once()
+            assert len(api._rate_limit._request_starts) == 1
+
+    async def test_get_devices_validation_error(self, hass, api_token, caplog):
+        """Test that a GET 400 without API message shows the error itself."""
+        # Arrange
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            error = ValidationError("Bad Request")
+            mock_client._make_request = AsyncMock(side_effect=error)
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+            # Act & Assert
+            with pytest.raises(HomeAssistantError) as exc_info:
+                await api.get_devices()
+
+            assert exc_info.value.translation_key == "bad_request"
+            assert exc_info.value.translation_placeholders["error"] == "Bad Request"
+            assert "Validation error fetching devices: Bad Request" in caplog.text
+
+    async def test_get_devices_rate_limit_error(self, hass, api_token):
+        """Test that a long Retry-After on the device list fails fast."""
+        # Arrange
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            error = RateLimitError("Too Many Requests", retry_after=30)
+            mock_client._make_request = AsyncMock(side_effect=error)
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+            # Act & Assert
+            with (
+                patch(
+                    "custom_components.energy_tracker.api.asyncio.sleep",
+                    new_callable=AsyncMock,
+                ) as mock_sleep,
+                pytest.raises(HomeAssistantError) as exc_info,
+            ):
+                await api.get_devices()
+
+            assert mock_client._make_request.call_count == 1
+            mock_sleep.assert_not_called()
+            assert exc_info.value.translation_key == "rate_limit"
+            assert exc_info.value.translation_placeholders["retry_after"] == "30"
+
+    async def test_get_devices_retries_short_rate_limit_once(self, hass, api_token):
+        """Test that a short Retry-After on the device list is retried once."""
+        # Arrange
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            error = RateLimitError("Too Many Requests", retry_after=2)
+            mock_client._make_request = AsyncMock(side_effect=error)
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+            # Act & Assert
+            with (
+                patch(
+                    "custom_components.energy_tracker.api.asyncio.sleep",
+                    new_callable=AsyncMock,
+                ) as mock_sleep,
+                pytest.raises(HomeAssistantError) as exc_info,
+            ):
+                await api.get_devices()
+
+            assert mock_client._make_request.call_count == 2
+            mock_sleep.assert_awaited_once()
+            assert mock_sleep.call_args.args[0] >= 2
+            assert exc_info.value.translation_key == "rate_limit"
+
+
+@pytest.mark.usefixtures("mock_get_session")
+class TestGetMeterReadings:
+    """Test fetching meter readings."""
+
+    async def test_get_meter_readings_sends_only_set_filters(
+        self, hass, api_token, device_id
+    ):
+        """Test that the sort order is always sent and unset filters are omitted."""
+        # Arrange
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            response = MagicMock()
+            response.read = AsyncMock(
+                return_value=json_dumps(
+                    [
+                        {
+                            "timestamp": "2025-11-28T10:30:00Z",
+                            "value": "1234.5",
+                            "rolloverOffset": 0,
+                            "meterId": "meter-1",
+                        }
+                    ]
+                ).encode()
+            )
+            mock_client._make_request = AsyncMock(return_value=response)
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+            # Act
+            readings = await api.get_meter_readings(
+                device_id, from_timestamp="2025-11-01T00:00:00Z"
+            )
+
+            # Assert
+            call_kwargs = mock_client._make_request.call_args.kwargs
+            assert call_kwargs["endpoint"] == (
+                f"/v3/devices/standard/{device_id}/meter-readings"
+            )
+            assert call_kwargs["params"] == {
+                "sort": "desc",
+                "from": "2025-11-01T00:00:00Z",
+            }
+            assert readings[0].value == "1234.5"
+            assert readings[0].note is None
+
+    async def test_get_meter_readings_not_found_error(self, hass, api_token, device_id):
+        """Test that an unknown device is translated to device_not_found."""
+        # Arrange
+        with patch(
+            "custom_components.energy_tracker.api.EnergyTrackerClient"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            error = ResourceNotFoundError("Not Found")
+            mock_client._make_request = AsyncMock(side_effect=error)
+            mock_client_class.return_value = mock_client
+
+            api = EnergyTrackerApi(hass=hass, token=api_token)
+
+            # Act & Assert
+            with pytest.raises(HomeAssistantError) as exc_info:
+                await api.get_meter_readings(device_id)
+
+            assert exc_info.value.translation_key == "device_not_found"
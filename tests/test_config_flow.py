@@ -43,6 +43,55 @@ async def test_user_form_create_entry(hass: HomeAssistant) -> None:
     }
 
 
+async def test_user_form_strips_token(hass: HomeAssistant) -> None:
+    """Test that surrounding whitespace is removed from a pasted token."""
+    # Arrange
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    # Act
+    with patch(
+        "homeassistant.config_entries.ConfigEntries.async_forward_entry_setups",
+        new_callable=AsyncMock,
+    ):
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {
+                CONF_NAME: "John's Account",
+                CONF_API_TOKEN: "  test-token-123\n",
+            },
+        )
+
+    # Assert
+    assert result2["type"] == FlowResultType.CREATE_ENTRY
+    assert result2["data"] == {CONF_API_TOKEN: "test-token-123"}
+    assert result2["result"].unique_id == "test-token-123"
+
+
+async def test_user_form_invalid_token(hass: HomeAssistant) -> None:
+    """Test that a malformed token is rejected without creating an entry."""
+    # Arrange
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    # Act
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            CONF_NAME: "John's Account",
+            CONF_API_TOKEN: "test token 123",
+        },
+    )
+
+    # Assert
+    assert result2["type"] == FlowResultType.FORM
+    assert result2["step_id"] == "user"
+    assert result2["errors"] == {CONF_API_TOKEN: "invalid_token"}
+    assert not hass.config_entries.async_entries(DOMAIN)
+
+
 async def test_user_form_duplicate_token(hass: HomeAssistant) -> None:
     """Test abort when token already configured."""
     # Arrange
@@ -72,6 +121,34 @@ async def test_user_form_duplicate_token(hass: HomeAssistant) -> None:
     assert result2["reason"] == "already_configured"
 
 
+async def test_reconfigure_form_suggests_current_token(hass: HomeAssistant) -> None:
+    """Test that the reconfigure form is prefilled with the current token."""
+    # Arrange
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Energy Tracker",
+        data={CONF_API_TOKEN: "old-token"},
+        unique_id="old-token",
+    )
+    entry.add_to_hass(hass)
+
+    # Act
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={
+            "source": "reconfigure",
+            "entry_id": entry.entry_id,
+        },
+    )
+
+    # Assert
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "reconfigure"
+    key = next(iter(result["data_schema"].schema))
+    assert key == CONF_API_TOKEN
+    assert key.description == {"suggested_value": "old-token"}
+
+
 async def test_reconfigure_form_update_token(hass: HomeAssistant) -> None:
     """Test reconfiguring to update the token."""
     # Arrange
@@ -150,3 +227,36 @@ async def test_reconfigure_form_duplicate_token(hass: HomeAssistant) -> None:
     # Assert
     assert result2["type"] == FlowResultType.ABORT
     assert result2["reason"] == "already_configured"
+
+
+async def test_reconfigure_form_invalid_token(hass: HomeAssistant) -> None:
+    """Test that reconfiguring with a malformed token keeps the old one."""
+    # Arrange
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Energy Tracker",
+        data={CONF_API_TOKEN: "old-token"},
+        unique_id="old-token",
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={
+            "source": "reconfigure",
+            "entry_id": entry.entry_id,
+        },
+    )
+
+    # Act
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            CONF_API_TOKEN: "new\ttoken",
+        },
+    )
+
+    # Assert
+    assert result2["type"] == FlowResultType.FORM
+    assert result2["errors"] == {CONF_API_TOKEN: "invalid_token"}
+    assert entry.data == {CONF_API_TOKEN: "old-token"}
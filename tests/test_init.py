@@ -16,6 +16,7 @@ from custom_components.energy_tracker import (
     async_setup_entry,
     async_unload_entry,
 )
+from custom_components.energy_tracker.api import DATA_CONNECTOR, EnergyTrackerApi
 from custom_components.energy_tracker.const import (
     CONF_API_TOKEN,
     DOMAIN,
@@ -51,8 +52,8 @@ class TestAsyncSetup:
 class TestAsyncSetupEntry:
     """Test async_setup_entry function."""
 
-    async def test_setup_entry_stores_token_in_runtime_data(self, hass: HomeAssistant):
-        """Test that setup_entry stores API token in runtime_data."""
+    async def test_setup_entry_stores_api_in_runtime_data(self, hass: HomeAssistant):
+        """Test that setup_entry stores an API client for the token in runtime_data."""
         # Arrange
         entry = MockConfigEntry(
             domain=DOMAIN,
@@ -71,7 +72,8 @@ class TestAsyncSetupEntry:
 
         # Assert
         assert result is True
-        assert entry.runtime_data == "test-token-123"
+        assert isinstance(entry.runtime_data, EnergyTrackerApi)
+        assert entry.runtime_data._token == "test-token-123"
 
     async def test_setup_entry_registers_service_once(self, hass: HomeAssistant):
         """Test that service is registered only once for multiple entries."""
@@ -136,6 +138,68 @@ class TestAsyncUnloadEntry:
         # Assert
         assert result is True
 
+    async def test_unload_entry_closes_api_session(self, hass: HomeAssistant):
+        """Test that unload_entry closes the HTTP session of the API client."""
+        # Arrange
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title="Test Account",
+            data={CONF_API_TOKEN: "test-token"},
+            entry_id="test-entry-id",
+        )
+        entry.add_to_hass(hass)
+        with patch(
+            "homeassistant.config_entries.ConfigEntries.async_forward_entry_setups",
+            new_callable=AsyncMock,
+        ):
+            await async_setup_entry(hass, entry)
+
+        # Act
+        with (
+            patch(
+                "homeassistant.config_entries.ConfigEntries.async_unload_platforms",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+            patch.object(
+                entry.runtime_data, "async_close", new_callable=AsyncMock
+            ) as mock_close,
+        ):
+            await async_unload_entry(hass, entry)
+
+        # Assert
+        mock_close.assert_awaited_once()
+
+    async def test_unload_last_entry_closes_shared_connector(self, hass: HomeAssistant):
+        """Test that unloading the last entry closes the shared connection pool."""
+        # Arrange
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title="Test Account",
+            data={CONF_API_TOKEN: "test-token"},
+            entry_id="test-entry-id",
+        )
+        entry.add_to_hass(hass)
+        with patch(
+            "homeassistant.config_entries.ConfigEntries.async_forward_entry_setups",
+            new_callable=AsyncMock,
+        ):
+            await async_setup_entry(hass, entry)
+        entry.runtime_data._async_get_session()
+        connector = hass.data[DATA_CONNECTOR]
+
+        # Act
+        with patch(
+            "homeassistant.config_entries.ConfigEntries.async_unload_platforms",
+            new_callable=AsyncMock,
+            return_value=True,
+        ):
+            await async_unload_entry(hass, entry)
+
+        # Assert
+        assert connector.closed
+        assert DATA_CONNECTOR not in hass.data
+
     async def test_unload_last_entry_removes_service(self, hass: HomeAssistant):
         """Test that unloading last entry removes service."""
         # Arrange
@@ -203,7 +267,7 @@ class TestAsyncUnloadEntry:
         # Assert
         assert hass.services.has_service(DOMAIN, SERVICE_SEND_METER_READING)
         # entry2 still has its runtime_data
-        assert entry2.runtime_data == "token-2"
+        assert entry2.runtime_data._token == "token-2"
 
 
 class TestAsyncHandleSendMeterReading:
@@ -0,0 +1,366 @@
+"""Tests for the Energy Tracker sensor platform."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+import logging
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.update_coordinator import UpdateFailed
+import pytest
+
+from custom_components.energy_tracker.api import DeviceSummary, MeterReading
+from custom_components.energy_tracker.const import (
+    DEFAULT_SCAN_INTERVAL,
+    SCAN_INTERVAL_JITTER,
+)
+from custom_components.energy_tracker.sensor import (
+    DeviceState,
+    EnergyTrackerDataUpdateCoordinator,
+    EnergyTrackerDeviceStatusSensor,
+    EnergyTrackerLatestReadingSensor,
+    _device_info,
+    async_setup_entry,
+)
+
+
+def create_device(device_id: str) -> DeviceSummary:
+    """Create a device summary for testing."""
+    return DeviceSummary(
+        id=device_id,
+        name=f"Device {device_id}",
+        folder_path="/Home",
+        last_updated_at="2025-11-28T10:30:00Z",
+    )
+
+
+def create_reading(value: str) -> MeterReading:
+    """Create a meter reading for testing."""
+    return MeterReading(
+        timestamp="2025-11-28T10:30:00Z",
+        value=value,
+        rollover_offset=0,
+        note=None,
+        meter_id="meter-1",
+        meter_number=None,
+    )
+
+
+def create_coordinator(
+    hass: HomeAssistant, api: MagicMock
+) -> EnergyTrackerDataUpdateCoordinator:
+    """Create a coordinator backed by a mocked API."""
+    return EnergyTrackerDataUpdateCoordinator(
+        hass=hass,
+        api=api,
+        update_interval=DEFAULT_SCAN_INTERVAL,
+    )
+
+
+class TestEnergyTrackerDataUpdateCoordinator:
+    """Test the data update coordinator."""
+
+    async def test_update_fetches_readings_concurrently(self, hass: HomeAssistant):
+        """Test that readings of all devices are fetched in parallel."""
+        # Arrange
+        devices = [create_device(f"device-{index}") for index in range(3)]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_meter_readings(device_id, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return [create_reading(device_id[-1])]
+
+        api = MagicMock()
+        api.get_devices = AsyncMock(return_value=devices)
+        api.get_meter_readings = AsyncMock(side_effect=get_meter_readings)
+        coordinator = create_coordinator(hass, api)
+
+        # Act
+        data = await coordinator._async_update_data()
+
+        # Assert
+        assert max_in_flight == 3
+        assert list(data) == ["device-0", "device-1", "device-2"]
+        assert data["device-2"].device is devices[2]
+        assert data["device-2"].latest_reading.value == "2"
+
+    async def test_update_limits_parallel_fetches(self, hass: HomeAssistant):
+        """Test that the fetch semaphore bounds concurrent reading requests."""
+        # Arrange
+        devices = [create_device(f"device-{index}") for index in range(5)]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_meter_readings(device_id, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return []
+
+        api = MagicMock()
+        api.get_devices = AsyncMock(return_value=devices)
+        api.get_meter_readings = AsyncMock(side_effect=get_meter_readings)
+        coordinator = create_coordinator(hass, api)
+        coordinator.fetch_semaphore = asyncio.Semaphore(2)
+
+        # Act
+        await coordinator._async_update_data()
+
+        # Assert
+        assert api.get_meter_readings.call_count == 5
+        assert max_in_flight == 2
+
+    async def test_update_keeps_device_when_readings_fail(self, hass: HomeAssistant):
+        """Test that a failed reading fetch still includes the device."""
+        # Arrange
+        devices = [create_device("device-0"), create_device("device-1")]
+        api = MagicMock()
+        api.get_devices = AsyncMock(return_value=devices)
+        api.get_meter_readings = AsyncMock(
+            side_effect=[HomeAssistantError("boom"), [create_reading("1.5")]]
+        )
+        coordinator = create_coordinator(hass, api)
+
+        # Act
+        data = await coordinator._async_update_data()
+
+        # Assert
+        assert data["device-0"].latest_reading is None
+        assert data["device-1"].latest_reading.value == "1.5"
+
+    async def test_update_fails_when_devices_cannot_be_fetched(
+        self, hass: HomeAssistant
+    ):
+        """Test that a failed device list fetch raises UpdateFailed."""
+        # Arrange
+        api = MagicMock()
+        api.get_devices = AsyncMock(side_effect=HomeAssistantError("boom"))
+        coordinator = create_coordinator(hass, api)
+
+        # Act & Assert
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+    async def test_update_fetches_only_new_readings(self, hass: HomeAssistant):
+        """Test that later refreshes request readings from the last known one."""
+        # Arrange
+        device = create_device("device-0")
+        previous = create_reading("1.0")
+        api = MagicMock()
+        api.get_devices = AsyncMock(return_value=[device])
+        api.get_meter_readings = AsyncMock(return_value=[create_reading("2.0")])
+        coordinator = create_coordinator(hass, api)
+        coordinator.data = {
+            "device-0": DeviceState(device=device, latest_reading=previous)
+        }
+
+        # Act
+        data = await coordinator._async_update_data()
+
+        # Assert
+        api.get_meter_readings.assert_awaited_once_with(
+            "device-0", from_timestamp=previous.timestamp, sort="desc"
+        )
+        assert data["device-0"].latest_reading.value == "2.0"
+
+    async def test_update_refetches_history_when_latest_reading_is_gone(
+        self, hass: HomeAssistant
+    ):
+        """Test that the full history is fetched if no newer readings are found."""
+        # Arrange
+        device = create_device("device-0")
+        previous = create_reading("1.0")
+        api = MagicMock()
+        api.get_devices = AsyncMock(return_value=[device])
+        api.get_meter_readings = AsyncMock(side_effect=[[], [create_reading("0.5")]])
+        coordinator = create_coordinator(hass, api)
+        coordinator.data = {
+            "device-0": DeviceState(device=device, latest_reading=previous)
+        }
+
+        # Act
+        data = await coordinator._async_update_data()
+
+        # Assert
+        assert api.get_meter_readings.await_count == 2
+        assert api.get_meter_readings.call_args.kwargs == {"sort": "desc"}
+        assert data["device-0"].latest_reading.value == "0.5"
+
+    async def test_update_skips_unchanged_devices(self, hass: HomeAssistant):
+        """Test that readings are only refetched for devices that changed."""
+        # Arrange
+        api = MagicMock()
+        api.get_devices = AsyncMock(return_value=[create_device("device-0")])
+        api.get_meter_readings = AsyncMock(return_value=[create_reading("1.0")])
+        coordinator = create_coordinator(hass, api)
+        coordinator.data = await coordinator._async_update_data()
+
+        # Act
+        unchanged = await coordinator._async_update_data()
+        coordinator.data = unchanged
+        api.get_devices.return_value = [
+            replace(create_device("device-0"), last_updated_at="2025-11-29T08:00:00Z")
+        ]
+        changed = await coordinator._async_update_data()
+
+        # Assert
+        assert api.get_meter_readings.await_count == 2
+        assert unchanged["device-0"].latest_reading.value == "1.0"
+        assert changed["device-0"].device.last_updated_at == "2025-11-29T08:00:00Z"
+
+    async def test_update_logs_non_numeric_reading(
+        self, hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+    ):
+        """Test that debug logging of a non-numeric reading does not fail."""
+        # Arrange
+        caplog.set_level(logging.DEBUG, logger="custom_components.energy_tracker")
+        api = MagicMock()
+        api.get_devices = AsyncMock(return_value=[create_device("device-0")])
+        api.get_meter_readings = AsyncMock(return_value=[create_reading("n/a")])
+        coordinator = create_coordinator(hass, api)
+
+        # Act
+        data = await coordinator._async_update_data()
+
+        # Assert
+        assert data["device-0"].latest_reading.value == "n/a"
+        assert "Latest reading n/a" in caplog.text
+
+
+class TestEnergyTrackerSensors:
+    """Test the sensor entities."""
+
+    async def test_latest_reading_sensor_state(self, hass: HomeAssistant):
+        """Test that the reading value and attributes are derived from the data."""
+        # Arrange
+        device = create_device("device-0")
+        coordinator = create_coordinator(hass, MagicMock())
+        coordinator.data = {
+            "device-0": DeviceState(
+                device=device, latest_reading=create_reading("12.5")
+            )
+        }
+
+        # Act
+        sensor = EnergyTrackerLatestReadingSensor(
+            coordinator, "device-0", _device_info(device)
+        )
+
+        # Assert
+        assert sensor.unique_id == "device-0_latest_reading"
+        assert sensor.translation_key == "latest_reading"
+        assert sensor.native_value == 12.5
+        assert sensor.extra_state_attributes == {
+            "timestamp": "2025-11-28T10:30:00Z",
+            "rollover_offset": 0,
+        }
+
+    async def test_latest_reading_sensor_invalid_value(self, hass: HomeAssistant):
+        """Test that a non-numeric reading value results in an unknown state."""
+        # Arrange
+        device = create_device("device-0")
+        coordinator = create_coordinator(hass, MagicMock())
+        coordinator.data = {
+            "device-0": DeviceState(device=device, latest_reading=create_reading("n/a"))
+        }
+
+        # Act
+        sensor = EnergyTrackerLatestReadingSensor(
+            coordinator, "device-0", _device_info(device)
+        )
+
+        # Assert
+        assert sensor.native_value is None
+
+    async def test_status_sensor_recomputes_on_coordinator_update(
+        self, hass: HomeAssistant
+    ):
+        """Test that the status is recomputed when the coordinator updates."""
+        # Arrange
+        device = create_device("device-0")
+        coordinator = create_coordinator(hass, MagicMock())
+        coordinator.data = {"device-0": DeviceState(device=device, latest_reading=None)}
+        sensor = EnergyTrackerDeviceStatusSensor(
+            coordinator, "device-0", _device_info(device)
+        )
+        assert sensor.native_value == "no_readings"
+
+        coordinator.data = {
+            "device-0": DeviceState(device=device, latest_reading=create_reading("1.0"))
+        }
+
+        # Act
+        with patch.object(sensor, "async_write_ha_state") as mock_write:
+            sensor._handle_coordinator_update()
+
+        # Assert
+        mock_write.assert_called_once()
+        assert sensor.native_value == "active"
+        assert sensor.extra_state_attributes["meter_id"] == "meter-1"
+
+    async def test_setup_entry_shares_device_info(self, hass: HomeAssistant):
+        """Test that all sensors of a device share one DeviceInfo."""
+        # Arrange
+        device = create_device("device-0")
+        entry = SimpleNamespace(entry_id="test-entry", runtime_data=MagicMock())
+        async_add_entities = MagicMock()
+
+        async def first_refresh(coordinator):
+            coordinator.data = {
+                "device-0": DeviceState(device=device, latest_reading=None)
+            }
+
+        # Act
+        with patch.object(
+            EnergyTrackerDataUpdateCoordinator,
+            "async_config_entry_first_refresh",
+            first_refresh,
+        ):
+            await async_setup_entry(hass, entry, async_add_entities)
+
+        # Assert
+        entities = async_add_entities.call_args.args[0]
+        assert len(entities) == 3
+        assert all(entity.device_info is entities[0].device_info for entity in entities)
+
+    async def test_setup_entry_jitters_update_interval(self, hass: HomeAssistant):
+        """Test that each entry's update interval gets its own random offset."""
+        # Arrange
+        entry = SimpleNamespace(entry_id="test-entry", runtime_data=MagicMock())
+        coordinators: list[EnergyTrackerDataUpdateCoordinator] = []
+
+        async def first_refresh(coordinator):
+            coordinators.append(coordinator)
+            coordinator.data = {}
+
+        # Act
+        with (
+            patch.object(
+                EnergyTrackerDataUpdateCoordinator,
+                "async_config_entry_first_refresh",
+                first_refresh,
+            ),
+            patch(
+                "custom_components.energy_tracker.sensor.random.uniform",
+                side_effect=[0.25, 0.75],
+            ),
+        ):
+            await async_setup_entry(hass, entry, MagicMock())
+            await async_setup_entry(hass, entry, MagicMock())
+
+        # Assert
+        assert [coordinator.update_interval for coordinator in coordinators] == [
+            DEFAULT_SCAN_INTERVAL + 0.25 * SCAN_INTERVAL_JITTER,
+            DEFAULT_SCAN_INTERVAL + 0.75 * SCAN_INTERVAL_JITTER,
+        ]
@@ -1,25 +1,35 @@
+from functools import cache
 import json
 from pathlib import Path
+import sys
 
 # Mapping: alte Titel/Beschreibungen -> neue (generisch, funktioniert für die meisten Sprachen)
 translations_dir = Path("custom_components/energy_tracker/translations")
 
+
+# Lade eine Sprachdatei nur einmal, auch wenn mehrere Sprachen sie als Referenz nutzen
+@cache
+def load_translation(name):
+    return json.loads((translations_dir / f"{name}.json").read_text(encoding="utf-8"))
+
+
 # Lade die englische Version als Referenz
-with open(translations_dir / "en.json", 'r', encoding='utf-8') as f:
-    en_data = json.load(f)
+en_data = load_translation("en")
 
 # Lade die deutsche Version als Referenz
-with open(translations_dir / "de.json", 'r', encoding='utf-8') as f:
-    de_data = json.load(f)
+de_data = load_translation("de")
 
 # Definiere die neuen Texte, die wir für jede Sprache manuell übersetzen müssen
 # Für jetzt: nur EN und DE sind fertig, andere behalten alte Titel aber ohne name-Felder
 
-print("English and German translations are already updated.")
-print("Other languages: Keys removed, but titles/descriptions kept as-is.")
-print("\nTo fully translate, each language would need manual translation of:")
-print("- user.title: 'Set up Energy Tracker' / 'Energy Tracker einrichten'")
-print("- user.description: Updated description without name mention")
-print("- reconfigure.title: 'Reconfigure Energy Tracker' / 'Energy Tracker neu konfigurieren'")
-print("- reconfigure.description: Updated description")
+# Gib den Hinweis in einem einzigen Schreibvorgang aus
+sys.stdout.write(
+    "English and German translations are already updated.\n"
+    "Other languages: Keys removed, but titles/descriptions kept as-is.\n"
+    "\nTo fully translate, each language would need manual translation of:\n"
+    "- user.title: 'Set up Energy Tracker' / 'Energy Tracker einrichten'\n"
+    "- user.description: Updated description without name mention\n"
+    "- reconfigure.title: 'Reconfigure Energy Tracker' / 'Energy Tracker neu konfigurieren'\n"
+    "- reconfigure.description: Updated description\n"
+)
 